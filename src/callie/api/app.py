@@ -118,8 +118,6 @@ def get_workflow_engine() -> WorkflowEngine:
 
 def inject_credentials_into_workflow(workflow: WorkflowConfig, credentials: Dict[str, str]) -> WorkflowConfig:
     """Inject real API credentials into workflow configuration."""
-    import json
-    
     # Convert workflow to JSON string
     workflow_json = workflow.model_dump_json()
     
@@ -128,9 +126,8 @@ def inject_credentials_into_workflow(workflow: WorkflowConfig, credentials: Dict
         placeholder = f"${{{var_name}}}"
         workflow_json = workflow_json.replace(placeholder, var_value)
     
-    # Convert back to WorkflowConfig
-    workflow_dict = json.loads(workflow_json)
-    return WorkflowConfig(**workflow_dict)
+    # Convert back to WorkflowConfig, parsing the JSON directly in pydantic-core
+    return WorkflowConfig.model_validate_json(workflow_json)
 
 
 # Request/Response models - These can be removed if they are no longer needed
@@ -369,7 +366,7 @@ async def execute_workflow_sync(
 
         # Execute workflow synchronously
         try:
-            execution = workflow_engine.execute_workflow(workflow, triggered_by="manual-sync", initial_variables=credentials)
+            execution = await workflow_engine.execute_workflow_async(workflow, triggered_by="manual-sync", initial_variables=credentials)
         except Exception as e:
             logger.error(f"Error in execute_workflow: {e}", exc_info=True)
             raise HTTPException(status_code=500, detail="Error executing workflow.")
@@ -5,10 +5,60 @@ Base connector class for all service integrations.
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import json
 import logging
+import requests
 
 logger = logging.getLogger(__name__)
 
+# Transient failures (rate limiting, gateway errors) are retried by the session
+# with exponential backoff instead of aborting a whole paginated read.
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+
+
+def build_http_session(pool_maxsize: int = 10) -> requests.Session:
+    """
+    Create a pooled requests session for a connector.
+    
+    Connections are kept alive and reused across calls. Idempotent GET and PUT
+    requests are retried (429/5xx, exponential backoff, honouring Retry-After);
+    POSTs such as product creation are never replayed automatically. Sessions
+    hold open sockets, so create them after any process fork rather than
+    sharing one across processes.
+    
+    Args:
+        pool_maxsize: Connections kept per host; should cover the connector's
+            concurrent request fan-out
+    """
+    retry = Retry(
+        total=5,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=["GET", "PUT"],
+        backoff_factor=0.5,
+        respect_retry_after_header=True
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=pool_maxsize)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def decode_json(response: requests.Response) -> Any:
+    """Decode a JSON response body; invalid bodies raise requests' JSONDecodeError."""
+    return response.json()
+
+
+def encode_json(data: Any) -> bytes:
+    """
+    Encode a JSON request body, rejecting NaN/Infinity as requests' ``json=`` does.
+    
+    Pass the result as ``data=`` with an explicit JSON Content-Type header.
+    """
+    return json.dumps(data, allow_nan=False).encode("utf-8")
+
 
 class ConnectorCapability(BaseModel):
     """Defines what operations a connector supports."""
@@ -41,20 +91,22 @@ class ConnectorSchema(BaseModel):
 class BaseConnector(ABC):
     """Abstract base class for connectors."""
     
-    def __init__(self, credentials: Optional[Dict[str, Any]] = None, base_url: Optional[str] = None, **kwargs):
+    def __init__(self, credentials: Optional[Dict[str, Any]] = None, base_url: Optional[str] = None, session: Optional[requests.Session] = None, **kwargs):
         """
         Initialize the connector.
         
         Args:
             credentials: Optional authentication credentials (can be provided per-method)
             base_url: Optional base URL for API (can be provided per-method)
+            session: Optional shared HTTP session; connectors build their own if omitted
             **kwargs: Additional configuration parameters
         """
         self.credentials = credentials or {}
         self.base_url = base_url
+        self.session = session
         self.config = kwargs
         # self._validate_credentials() # This is now handled by each connector method
-        logger.info(f"Initialized {self.__class__.__name__} connector")
+        logger.info("Initialized %s connector", self.__class__.__name__)
     
     def get_capabilities(self) -> ConnectorCapability:
         """Return what operations this connector supports."""
@@ -70,6 +122,10 @@ class BaseConnector(ABC):
         """Test if the connector can successfully connect to the service."""
         pass
     
+    def reset(self):
+        """Drop per-execution state before the connector is reused for another workflow run."""
+        pass
+    
     # Inventory Operations
     def read_inventory(self, **filters) -> List[Dict[str, Any]]:
         """
@@ -4,13 +4,70 @@ InfiPlex connector for reading and writing inventory data.
 
 import requests
 import logging
+import threading
 import urllib.parse
 from typing import Dict, List, Any, Optional
 from ..exceptions import InfiPlexAPIError
-from .base import BaseConnector, ConnectorCapability, ConnectorSchema, ConnectorField
+from .base import BaseConnector, ConnectorCapability, ConnectorSchema, ConnectorField, build_http_session, decode_json, encode_json
 
 logger = logging.getLogger(__name__)
 
+# Number of items sent per bulk_update request
+BULK_UPDATE_BATCH_SIZE = 500
+
+# Connector metadata is static, so build it once instead of on every call.
+_CAPABILITIES = ConnectorCapability(
+    can_read_inventory=True,
+    can_write_inventory=True,
+    can_read_products=True,
+    can_write_products=True
+)
+
+_INVENTORY_SCHEMA = ConnectorSchema(fields=[
+    ConnectorField(
+        name="sku",
+        description="Stock Keeping Unit identifier", 
+        data_type="string",
+        required=True,
+        example="ABC-123"
+    ),
+    ConnectorField(
+        name="quantity_to_set",
+        description="Quantity to set for this SKU",
+        data_type="integer",
+        required=True,
+        example=50
+    ),
+    ConnectorField(
+        name="warehouse_id",
+        description="Warehouse ID to update inventory for",
+        data_type="integer",
+        required=True,
+        example=17
+    ),
+    ConnectorField(
+        name="quantity",
+        description="Current quantity in warehouse (read-only)",
+        data_type="string",
+        required=False,
+        example="50"
+    ),
+    ConnectorField(
+        name="product_name",
+        description="Product name (read-only)",
+        data_type="string",
+        required=False,
+        example="Sample Product"
+    ),
+    ConnectorField(
+        name="warehouse_name",
+        description="Warehouse name (read-only)",
+        data_type="string",
+        required=False,
+        example="Main Warehouse"
+    )
+])
+
 
 class InfiPlexConnector(BaseConnector):
     """
@@ -19,67 +76,35 @@ class InfiPlexConnector(BaseConnector):
     
     # No _validate_credentials needed here anymore
     
+    def __init__(self, credentials: Optional[Dict[str, Any]] = None, base_url: Optional[str] = None, session: Optional[requests.Session] = None, **kwargs):
+        super().__init__(credentials=credentials, base_url=base_url, session=session, **kwargs)
+        # Reused across paged reads, SKU checks and writes to keep connections alive
+        if self.session is None:
+            self.session = build_http_session()
+        # Existing SKU sets keyed by (base_url, api_key, warehouse_id), so writing
+        # to several warehouses only reads the full InfiPlex inventory once
+        self._existing_skus_cache: Dict[tuple, set] = {}
+        # One lock per cache key so concurrent writes wait for a single read
+        self._existing_skus_locks: Dict[tuple, threading.Lock] = {}
+        self._existing_skus_locks_guard = threading.Lock()
+    
+    def reset(self):
+        """Forget cached existing-SKU sets; products may have changed since the last run."""
+        self._existing_skus_cache.clear()
+    
     def get_capabilities(self) -> ConnectorCapability:
         """InfiPlex can read and write inventory."""
-        return ConnectorCapability(
-            can_read_inventory=True,
-            can_write_inventory=True,
-            can_read_products=True,
-            can_write_products=True
-        )
+        return _CAPABILITIES
     
     def get_inventory_schema(self) -> ConnectorSchema:
         """Return InfiPlex inventory schema."""
-        return ConnectorSchema(fields=[
-            ConnectorField(
-                name="sku",
-                description="Stock Keeping Unit identifier", 
-                data_type="string",
-                required=True,
-                example="ABC-123"
-            ),
-            ConnectorField(
-                name="quantity_to_set",
-                description="Quantity to set for this SKU",
-                data_type="integer",
-                required=True,
-                example=50
-            ),
-            ConnectorField(
-                name="warehouse_id",
-                description="Warehouse ID to update inventory for",
-                data_type="integer",
-                required=True,
-                example=17
-            ),
-            ConnectorField(
-                name="quantity",
-                description="Current quantity in warehouse (read-only)",
-                data_type="string",
-                required=False,
-                example="50"
-            ),
-            ConnectorField(
-                name="product_name",
-                description="Product name (read-only)",
-                data_type="string",
-                required=False,
-                example="Sample Product"
-            ),
-            ConnectorField(
-                name="warehouse_name",
-                description="Warehouse name (read-only)",
-                data_type="string",
-                required=False,
-                example="Main Warehouse"
-            )
-        ])
+        return _INVENTORY_SCHEMA
     
     def test_connection(self) -> bool:
         """Test connection to InfiPlex API."""
         try:
             # Try to search for inventory with limit 1
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/api/admin/shop/inventory/search",
                 headers={"Authorization": f"Bearer {self.credentials['api_key']}"},
                 params={"limit": 1},
@@ -87,7 +112,7 @@ class InfiPlexConnector(BaseConnector):
             )
             return response.status_code == 200
         except Exception as e:
-            logger.error(f"InfiPlex connection test failed: {e}")
+            logger.error("InfiPlex connection test failed: %s", e)
             return False
     
     def _read_inventory(self, api_key: str, base_url: str, **filters) -> List[Dict[str, Any]]:
@@ -125,9 +150,9 @@ class InfiPlexConnector(BaseConnector):
                 if "is_active" in filters:
                     params["is_active"] = filters["is_active"]
                 
-                logger.info(f"Fetching InfiPlex inventory page: limit={page_size}, limit_start={limit_start}, max_items={max_items}")
+                logger.info("Fetching InfiPlex inventory page: limit=%s, limit_start=%s, max_items=%s", page_size, limit_start, max_items)
                 
-                response = requests.get(
+                response = self.session.get(
                     f"{base_url}/api/admin/shop/inventory/search",
                     headers={"Authorization": f"Bearer {api_key}"},
                     params=params,
@@ -137,7 +162,7 @@ class InfiPlexConnector(BaseConnector):
                 if response.status_code != 200:
                     raise InfiPlexAPIError(f"HTTP {response.status_code}: {response.text}")
                 
-                data = response.json()
+                data = decode_json(response)
                 inventory_items = data.get("inventory", [])
                 
                 if not inventory_items:
@@ -156,7 +181,7 @@ class InfiPlexConnector(BaseConnector):
                         "warehouse_name": item.get("warehouse_name")
                     })
                 
-                logger.info(f"Fetched {len(inventory_items)} items from page (total so far: {len(all_items)})")
+                logger.info("Fetched %s items from page (total so far: %s)", len(inventory_items), len(all_items))
                 
                 # If we got fewer items than requested, we've reached the end
                 if len(inventory_items) < page_size:
@@ -167,9 +192,9 @@ class InfiPlexConnector(BaseConnector):
             
             pages_fetched = (limit_start // page_size) + 1
             if max_items is not None and len(all_items) >= max_items:
-                logger.warning(f"Reached max_items limit of {max_items}. There may be more inventory items available.")
+                logger.warning("Reached max_items limit of %s. There may be more inventory items available.", max_items)
             
-            logger.info(f"Successfully fetched {len(all_items)} total inventory items from InfiPlex across {pages_fetched} pages")
+            logger.info("Successfully fetched %s total inventory items from InfiPlex across %s pages", len(all_items), pages_fetched)
             return all_items
             
         except requests.exceptions.RequestException as e:
@@ -204,7 +229,7 @@ class InfiPlexConnector(BaseConnector):
                 return self._single_update_inventory(filtered_items[0], default_warehouse_id, api_key, base_url)
                 
         except Exception as e:
-            logger.error(f"An unexpected error occurred in _write_inventory: {e}", exc_info=True)
+            logger.error("An unexpected error occurred in _write_inventory: %s", e, exc_info=True)
             return {"success": 0, "failed": len(items), "total": len(items), "error": str(e)}
     
     def _filter_existing_skus(self, items: List[Dict[str, Any]], default_warehouse_id: Optional[int], api_key: str, base_url: str) -> List[Dict[str, Any]]:
@@ -227,18 +252,34 @@ class InfiPlexConnector(BaseConnector):
         try:
             # Use the passed-in warehouse_id for the check, not a hardcoded one.
             warehouse_id_to_check = default_warehouse_id
-            existing_inventory = self._read_inventory(api_key=api_key, base_url=base_url, warehouse_id=warehouse_id_to_check)
-            existing_skus = set(item.get("sku") for item in existing_inventory if item.get("sku"))
+            existing_skus = self._get_existing_skus(api_key, base_url, warehouse_id_to_check)
             
             filtered_items = [item for item in items if item.get("sku") in existing_skus]
             
             return filtered_items
             
         except Exception as e:
-            logger.error(f"Error filtering existing SKUs in InfiPlex: {e}")
+            logger.error("Error filtering existing SKUs in InfiPlex: %s", e)
             # In case of failure, return the original list to attempt all updates
             return items
     
+    def _get_existing_skus(self, api_key: str, base_url: str, warehouse_id: Optional[int]) -> set:
+        """Return the set of SKUs that exist in InfiPlex, reading inventory at most once."""
+        cache_key = (base_url, api_key, warehouse_id)
+        with self._existing_skus_locks_guard:
+            key_lock = self._existing_skus_locks.setdefault(cache_key, threading.Lock())
+        
+        # Held across the read so a concurrent caller for the same key reuses its result
+        with key_lock:
+            existing_skus = self._existing_skus_cache.get(cache_key)
+            if existing_skus is None:
+                existing_inventory = self._read_inventory(api_key=api_key, base_url=base_url, warehouse_id=warehouse_id)
+                existing_skus = {item["sku"] for item in existing_inventory if item.get("sku")}
+                self._existing_skus_cache[cache_key] = existing_skus
+            else:
+                logger.info("Reusing %s existing InfiPlex SKUs read earlier in this run", len(existing_skus))
+        return existing_skus
+    
     def _single_update_inventory(self, item: Dict[str, Any], default_warehouse_id: Optional[int], api_key: str, base_url: str) -> Dict[str, Any]:
         """Update a single inventory item."""
         sku = item.get("sku")
@@ -258,7 +299,7 @@ class InfiPlexConnector(BaseConnector):
                 "warehouse_id": warehouse_id
             }
             
-            response = requests.put(
+            response = self.session.put(
                 f"{base_url}/api/admin/shop/inventory/{sku}",
                 headers={
                     "Authorization": f"Bearer {api_key}",
@@ -269,21 +310,22 @@ class InfiPlexConnector(BaseConnector):
             )
             
             if response.status_code == 200:
-                logger.info(f"Successfully updated inventory for SKU {sku} to quantity {quantity}")
+                logger.info("Successfully updated inventory for SKU %s to quantity %s", sku, quantity)
                 return {"success": 1, "failed": 0, "total": 1}
             else:
-                logger.error(f"Failed to update SKU {sku}: HTTP {response.status_code} - {response.text}")
+                logger.error("Failed to update SKU %s: HTTP %s - %s", sku, response.status_code, response.text)
                 return {"success": 0, "failed": 1, "total": 1}
                 
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request failed for SKU {sku}: {e}")
+            logger.error("Request failed for SKU %s: %s", sku, e)
             return {"success": 0, "failed": 1, "total": 1}
     
     def _bulk_update_inventory(self, items: List[Dict[str, Any]], default_warehouse_id: Optional[int], api_key: str, base_url: str) -> Dict[str, Any]:
         """Update multiple inventory items using bulk endpoint."""
         
-        # Prepare bulk payload
-        bulk_items = []
+        # Prepare bulk payload, keyed by (sku, warehouse) so duplicate rows are
+        # sent once with the last quantity seen
+        bulk_by_key: Dict[tuple, Dict[str, Any]] = {}
         skipped_items = []
         
         for item in items:
@@ -299,56 +341,92 @@ class InfiPlexConnector(BaseConnector):
                 skipped_items.append(item)
                 continue
             
+            # Ensure it's an integer; mapped quantities are usually ints already
+            if type(quantity) is not int:
+                try:
+                    quantity = int(quantity)
+                except (TypeError, ValueError):
+                    logger.warning("Skipping SKU %s with non-integer quantity %r", sku, quantity)
+                    skipped_items.append(item)
+                    continue
+            
             # Clean and encode SKU to handle special characters
             clean_sku = str(sku).strip()
+            warehouse_id = str(warehouse_id)  # Convert to string to match InfiPlex format
             
-            bulk_items.append({
+            bulk_by_key[(clean_sku, warehouse_id)] = {
                 "sku": clean_sku,
-                "warehouse_id": str(warehouse_id),  # Convert to string to match InfiPlex format
-                "quantity_to_set": int(quantity)    # Ensure it's an integer
-            })
+                "warehouse_id": warehouse_id,
+                "quantity_to_set": quantity
+            }
+        
+        bulk_items = list(bulk_by_key.values())
+        if len(bulk_items) < len(items) - len(skipped_items):
+            logger.info("Collapsed %s duplicate SKU rows before bulk update", len(items) - len(skipped_items) - len(bulk_items))
         
         if not bulk_items:
             return {"success": 0, "failed": len(items), "total": len(items)}
         
-        try:
-            # InfiPlex expects an array directly, NOT wrapped in an object
-            payload = bulk_items  # Send array directly
+        # Send large updates in bounded batches so one bad batch doesn't fail the whole write
+        batch_size = BULK_UPDATE_BATCH_SIZE
+        successful_results = []
+        sample_results = []
+        failed_count = 0
+        errors = []
+        
+        for start in range(0, len(bulk_items), batch_size):
+            batch = bulk_items[start:start + batch_size]
             
-            response = requests.post(
-                f"{base_url}/api/admin/shop/inventory/bulk_update",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json=payload,
-                timeout=60
-            )
+            try:
+                # InfiPlex expects an array directly, NOT wrapped in an object
+                response = self.session.post(
+                    f"{base_url}/api/admin/shop/inventory/bulk_update",
+                    headers={
+                        "Authorization": f"Bearer {api_key}",
+                        "Content-Type": "application/json"
+                    },
+                    data=encode_json(batch),
+                    timeout=60
+                )
+            except requests.exceptions.RequestException as e:
+                logger.error("Bulk update request failed for batch starting at %s: %s", start, e)
+                failed_count += len(batch)
+                errors.append(str(e))
+                continue
             
-            if response.status_code == 200:
-                results = response.json()
-                
-                # Enhanced result analysis
-                successful_results = [r for r in results if r.get("warehouse_inventory") is not None]
-                failed_results = [r for r in results if r.get("warehouse_inventory") is None]
-                
-                success_count = len(successful_results)
-                failed_count = len(failed_results)
-                
-                return {
-                    "success": success_count,
-                    "failed": failed_count,
-                    "total": len(bulk_items),
-                    "items": successful_results,  # Add items field for workflow engine
-                    "results": results[:10]  # Sample results for debugging
-                }
-            else:
-                logger.error(f"Bulk update failed: HTTP {response.status_code} - {response.text}")
-                raise InfiPlexAPIError(f"Bulk update failed: HTTP {response.status_code} - {response.text}")
-                
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Bulk update request failed: {e}")
-            return {"success": 0, "failed": len(bulk_items), "total": len(bulk_items)}
+            if response.status_code != 200:
+                logger.error("Bulk update failed: HTTP %s - %s", response.status_code, response.text)
+                failed_count += len(batch)
+                errors.append(f"Bulk update failed: HTTP {response.status_code} - {response.text}")
+                continue
+            
+            try:
+                results = decode_json(response)
+                # Enhanced result analysis, classifying each result in a single pass
+                batch_successes = [r for r in results if r.get("warehouse_inventory") is not None]
+            except (ValueError, TypeError, AttributeError) as e:
+                # The batch may have been applied, but its outcome can't be confirmed
+                logger.error("Unreadable bulk update response for batch starting at %s: %s", start, e)
+                failed_count += len(batch)
+                errors.append(f"Unreadable bulk update response: {e}")
+                continue
+            
+            successful_results.extend(batch_successes)
+            failed_count += len(results) - len(batch_successes)
+            
+            if len(sample_results) < 10:
+                sample_results.extend(results[:10 - len(sample_results)])
+        
+        result = {
+            "success": len(successful_results),
+            "failed": failed_count,
+            "total": len(bulk_items),
+            "items": successful_results,  # Add items field for workflow engine
+            "results": sample_results  # Sample results for debugging
+        }
+        if errors:
+            result["error"] = "; ".join(errors)
+        return result
 
     def _create_products(self, items: List[Dict[str, Any]] = None, api_key: str = None, base_url: str = None, **kwargs) -> Dict[str, Any]:
         """
@@ -401,22 +479,26 @@ class InfiPlexConnector(BaseConnector):
         try:
             # Make API call to create products
             
-            response = requests.post(
+            response = self.session.post(
                 f"{base_url}/api/admin/shop/products/",
                 headers={
                     "Authorization": f"Bearer {api_key}",
                     "Content-Type": "application/json"
                 },
-                json=products_to_create,
+                data=encode_json(products_to_create),
                 timeout=60
             )
             
             if response.status_code == 200:
-                result_data = response.json()
+                result_data = decode_json(response)
                 
-                success_count = len([r for r in result_data if "Product Created" in r.get("message", "")])
+                success_count = sum(1 for r in result_data if "Product Created" in r.get("message", ""))
                 failed_count = len(result_data) - success_count
                 
+                if success_count:
+                    # New products change which SKUs exist; re-read before the next write
+                    self._existing_skus_cache.clear()
+                
                 return {
                     "success": success_count,
                     "failed": failed_count,
@@ -425,11 +507,11 @@ class InfiPlexConnector(BaseConnector):
                     "results": result_data[:10]  # Sample results for debugging
                 }
             else:
-                logger.error(f"Products Create API failed: {response.status_code} - {response.text}")
+                logger.error("Products Create API failed: %s - %s", response.status_code, response.text)
                 return {"success": 0, "failed": len(products_to_create), "total": len(products_to_create), "items": []}
                 
         except Exception as e:
-            logger.error(f"Exception in _create_products: {str(e)}")
+            logger.error("Exception in _create_products: %s", e)
             return {"success": 0, "failed": len(products_to_create), "total": len(products_to_create), "items": []}
 
 
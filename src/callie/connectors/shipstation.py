@@ -4,12 +4,112 @@ ShipStation connector for reading inventory data.
 
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 from ..exceptions import ShipStationAPIError
-from .base import BaseConnector, ConnectorCapability, ConnectorSchema, ConnectorField
+from .base import BaseConnector, ConnectorCapability, ConnectorSchema, ConnectorField, build_http_session, decode_json
 
 logger = logging.getLogger(__name__)
 
+# Static connector metadata, built once at import time rather than per call.
+_CAPABILITIES = ConnectorCapability(
+    can_read_inventory=True,
+    can_write_inventory=False,
+    can_read_products=True,
+    can_write_products=False
+)
+
+_INVENTORY_SCHEMA = ConnectorSchema(fields=[
+    ConnectorField(
+        name="sku",
+        description="Stock Keeping Unit identifier",
+        data_type="string",
+        required=True,
+        example="ABC-123"
+    ),
+    ConnectorField(
+        name="on_hand",
+        description="Total quantity on hand",
+        data_type="integer",
+        required=True,
+        example=100
+    ),
+    ConnectorField(
+        name="allocated",
+        description="Quantity allocated to orders",
+        data_type="integer",
+        required=False,
+        example=5
+    ),
+    ConnectorField(
+        name="available",
+        description="Available quantity (on_hand - allocated)",
+        data_type="integer", 
+        required=True,
+        example=95
+    ),
+    ConnectorField(
+        name="average_cost",
+        description="Average cost per unit",
+        data_type="object",
+        required=False,
+        example={"amount": 10.50, "currency": "USD"}
+    ),
+    ConnectorField(
+        name="inventory_warehouse_id",
+        description="Warehouse ID where inventory is located",
+        data_type="string",
+        required=False,
+        example="warehouse-123"
+    ),
+    ConnectorField(
+        name="inventory_location_id", 
+        description="Location ID within warehouse",
+        data_type="string",
+        required=False,
+        example="location-456"
+    )
+])
+
+INVENTORY_PAGE_SIZE = 500
+PRODUCTS_PAGE_SIZE = 100
+# Kept small so concurrent requests stay within ShipStation rate limits
+PAGE_FETCH_WORKERS = 4
+SKU_LOOKUP_WORKERS = 8
+
+
+def _aggregate_by_sku(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Collapse inventory rows to one row per SKU, summing quantities.
+    
+    The first row seen for a SKU supplies its cost and warehouse/location
+    fields. Rows without a SKU are dropped.
+    """
+    sku_aggregated: Dict[str, Dict[str, Any]] = {}
+    for item in items:
+        sku = item.get("sku")
+        if not sku:
+            continue
+        
+        aggregated = sku_aggregated.get(sku)
+        if aggregated is None:
+            aggregated = sku_aggregated[sku] = {
+                "sku": sku,
+                "on_hand": 0,
+                "allocated": 0,
+                "available": 0,
+                "average_cost": item.get("average_cost"),
+                "inventory_warehouse_id": item.get("inventory_warehouse_id"),
+                "inventory_location_id": item.get("inventory_location_id")
+            }
+        
+        # Aggregate quantities across all warehouse locations
+        aggregated["on_hand"] += item.get("on_hand", 0)
+        aggregated["allocated"] += item.get("allocated", 0)
+        aggregated["available"] += item.get("available", 0)
+    
+    return list(sku_aggregated.values())
+
 
 class ShipStationConnector(BaseConnector):
     """
@@ -18,73 +118,25 @@ class ShipStationConnector(BaseConnector):
     Supports reading inventory levels and product information from ShipStation V2 API.
     """
     
+    def __init__(self, credentials: Optional[Dict[str, Any]] = None, base_url: Optional[str] = None, session: Optional[requests.Session] = None, **kwargs):
+        super().__init__(credentials=credentials, base_url=base_url, session=session, **kwargs)
+        # Retries are logged by urllib3 at DEBUG level. The pool covers the
+        # largest concurrent fan-out so parallel lookups reuse connections.
+        if self.session is None:
+            self.session = build_http_session(pool_maxsize=max(PAGE_FETCH_WORKERS, SKU_LOOKUP_WORKERS))
+    
     def get_capabilities(self) -> ConnectorCapability:
         """ShipStation can read inventory but not write."""
-        return ConnectorCapability(
-            can_read_inventory=True,
-            can_write_inventory=False,
-            can_read_products=True,
-            can_write_products=False
-        )
+        return _CAPABILITIES
     
     def get_inventory_schema(self) -> ConnectorSchema:
         """Return ShipStation inventory schema."""
-        return ConnectorSchema(fields=[
-            ConnectorField(
-                name="sku",
-                description="Stock Keeping Unit identifier",
-                data_type="string",
-                required=True,
-                example="ABC-123"
-            ),
-            ConnectorField(
-                name="on_hand",
-                description="Total quantity on hand",
-                data_type="integer",
-                required=True,
-                example=100
-            ),
-            ConnectorField(
-                name="allocated",
-                description="Quantity allocated to orders",
-                data_type="integer",
-                required=False,
-                example=5
-            ),
-            ConnectorField(
-                name="available",
-                description="Available quantity (on_hand - allocated)",
-                data_type="integer", 
-                required=True,
-                example=95
-            ),
-            ConnectorField(
-                name="average_cost",
-                description="Average cost per unit",
-                data_type="object",
-                required=False,
-                example={"amount": 10.50, "currency": "USD"}
-            ),
-            ConnectorField(
-                name="inventory_warehouse_id",
-                description="Warehouse ID where inventory is located",
-                data_type="string",
-                required=False,
-                example="warehouse-123"
-            ),
-            ConnectorField(
-                name="inventory_location_id", 
-                description="Location ID within warehouse",
-                data_type="string",
-                required=False,
-                example="location-456"
-            )
-        ])
+        return _INVENTORY_SCHEMA
     
     def test_connection(self) -> bool:
         """Test connection to ShipStation API."""
         try:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.base_url}/v2/inventory",
                 headers={"API-Key": self.credentials["api_key"]},
                 params={"limit": 1},
@@ -92,20 +144,21 @@ class ShipStationConnector(BaseConnector):
             )
             return response.status_code == 200
         except Exception as e:
-            logger.error(f"ShipStation connection test failed: {e}")
+            logger.error("ShipStation connection test failed: %s", e)
             return False
     
     def _read_inventory(self, api_key: str, base_url: str, **filters) -> List[Dict[str, Any]]:
         """
         Read inventory from ShipStation, now with robust pagination.
         """
-        # DEBUG: Log all parameters received
-        logger.info(f"ShipStation _read_inventory called with filters: {list(filters.keys())}")
-        for key, value in filters.items():
-            if key == "sku_list" and isinstance(value, list):
-                logger.info(f"sku_list parameter received with {len(value)} SKUs: {value[:5]}...")
-            else:
-                logger.info(f"Parameter {key}: {type(value).__name__} = {str(value)[:100]}...")
+        logger.info("ShipStation _read_inventory called with filters: %s", list(filters.keys()))
+        # Parameter dump renders every value, so only build it when DEBUG is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            for key, value in filters.items():
+                if key == "sku_list" and isinstance(value, list):
+                    logger.debug("sku_list parameter received with %s SKUs: %s...", len(value), value[:5])
+                else:
+                    logger.debug("Parameter %s: %s = %s...", key, type(value).__name__, str(value)[:100])
         
         # Handle specific SKU list for targeted sync
         limit = filters.get("limit")
@@ -118,16 +171,18 @@ class ShipStationConnector(BaseConnector):
             sku_list = filters["target_skus"]
         
         if sku_list:
+            # Each SKU costs a request, so drop duplicates (keeping first-seen order)
+            sku_list = list(dict.fromkeys(sku_list))
             if limit:
                 sku_list = sku_list[:limit] # Respect the limit
-            logger.info(f"Fetching ShipStation inventory for {len(sku_list)} specific SKUs")
+            logger.info("Fetching ShipStation inventory for %s specific SKUs", len(sku_list))
             return self._read_inventory_for_sku_list(sku_list, api_key, base_url)
 
         # --- REVISED PAGINATION LOGIC ---
         all_items = []
         
         # Build initial query parameters for the first request
-        params = {"limit": 500}  # Use max page size
+        params = {"limit": INVENTORY_PAGE_SIZE}  # Use max page size
         if "sku" in filters:
             params["sku"] = filters["sku"]
         if "inventory_warehouse_id" in filters:
@@ -137,89 +192,102 @@ class ShipStationConnector(BaseConnector):
         if "group_by" in filters:
             params["group_by"] = filters["group_by"]
         
-        next_url = f"{base_url}/v2/inventory"
-        page_num = 1
+        url = f"{base_url}/v2/inventory"
+        
+        # Track whether every row comes from one warehouse location. If so, SKUs
+        # are already unique and the aggregation pass below can be skipped.
+        first_location = None
+        single_location = True
 
         try:
-            while next_url:
-                logger.info(f"Fetching ShipStation inventory page {page_num} from URL: {next_url}")
-                
-                # Params are only needed for the very first request. 
-                # Subsequent requests use the full URL from the 'next' link.
-                request_params = params if page_num == 1 else None
-                
-                response = requests.get(
-                    next_url,
-                    headers={"API-Key": api_key},
-                    params=request_params,
-                    timeout=30
-                )
-                
-                if response.status_code != 200:
-                    raise ShipStationAPIError(f"HTTP {response.status_code}: {response.text}")
-                
-                data = response.json()
-                inventory_items = data.get("inventory", [])
-
-                if not inventory_items and page_num > 1:
-                    logger.info(f"No more inventory items returned on page {page_num}, stopping.")
-                    break
-                
-                # Convert to standard format
+            logger.info("Fetching ShipStation inventory page 1 from URL: %s", url)
+            data = self._fetch_inventory_page(url, api_key, params)
+            pages = [data.get("inventory", [])]
+            
+            total_pages = data.get("pages")
+            walk_next_links = True
+            if isinstance(total_pages, int):
+                # Page count is known, so the remaining pages are independent requests
+                last_page = total_pages
+                if limit:
+                    last_page = min(last_page, -(-limit // INVENTORY_PAGE_SIZE))
+                walk_next_links = False
+                if last_page > 1:
+                    logger.info("Fetching ShipStation inventory pages 2-%s concurrently", last_page)
+                    with ThreadPoolExecutor(max_workers=min(PAGE_FETCH_WORKERS, last_page - 1)) as executor:
+                        # map() preserves page order
+                        responses = list(executor.map(
+                            lambda page: self._fetch_inventory_page(url, api_key, {**params, "page": page}),
+                            range(2, last_page + 1)
+                        ))
+                    # Only trust the pages if the API honoured the page parameter;
+                    # repeated page-1 rows would otherwise be summed into the totals.
+                    if all(page_data.get("page") == page for page, page_data in zip(range(2, last_page + 1), responses)):
+                        pages.extend(page_data.get("inventory", []) for page_data in responses)
+                    else:
+                        logger.warning("ShipStation ignored the page parameter, falling back to 'next' links")
+                        walk_next_links = True
+            
+            if walk_next_links:
+                # Follow the 'next' links one at a time
+                page_num = 1
+                fetched = len(pages[0])
+                while not (limit and fetched >= limit):
+                    next_link_info = (data.get("links") or {}).get("next")
+                    if not (next_link_info and next_link_info.get("href")):
+                        logger.info("No 'next' link provided by ShipStation API. Reached the end.")
+                        break
+                    
+                    page_num += 1
+                    next_url = next_link_info["href"]
+                    logger.info("Fetching ShipStation inventory page %s from URL: %s", page_num, next_url)
+                    # The 'next' link already carries the query parameters
+                    data = self._fetch_inventory_page(next_url, api_key)
+                    inventory_items = data.get("inventory", [])
+                    if not inventory_items:
+                        logger.info("No more inventory items returned on page %s, stopping.", page_num)
+                        break
+                    pages.append(inventory_items)
+                    fetched += len(inventory_items)
+            
+            # Convert to standard format
+            for page_num, inventory_items in enumerate(pages, start=1):
                 for item in inventory_items:
+                    warehouse_id = item.get("inventory_warehouse_id")
+                    location_id = item.get("inventory_location_id")
+                    if single_location:
+                        location = (warehouse_id, location_id)
+                        if first_location is None:
+                            first_location = location
+                            # Rows without location info can't be proven unique
+                            single_location = location != (None, None)
+                        elif location != first_location:
+                            single_location = False
+                    
                     all_items.append({
                         "sku": item.get("sku"),
                         "on_hand": item.get("on_hand", 0),
                         "allocated": item.get("allocated", 0),
                         "available": item.get("available", 0),
                         "average_cost": item.get("average_cost"),
-                        "inventory_warehouse_id": item.get("inventory_warehouse_id"),
-                        "inventory_location_id": item.get("inventory_location_id")
+                        "inventory_warehouse_id": warehouse_id,
+                        "inventory_location_id": location_id
                     })
                 
-                logger.info(f"Fetched {len(inventory_items)} items from page {page_num}, total so far: {len(all_items)}")
-                
-                # NEW: Use the 'next' link for pagination
-                links = data.get("links", {})
-                next_link_info = links.get("next")
-                
-                if next_link_info and next_link_info.get("href"):
-                    next_url = next_link_info["href"]
-                    page_num += 1
-                else:
-                    logger.info("No 'next' link provided by ShipStation API. Reached the end.")
-                    next_url = None # End the loop
+                logger.info("Fetched %s items from page %s, total so far: %s", len(inventory_items), page_num, len(all_items))
             
             final_items = all_items[:limit] if limit else all_items  # Ensure we don't exceed requested limit
             
+            if single_location:
+                unique_items = [item for item in final_items if item.get("sku")]
+                logger.info("All %s items come from a single location, skipping SKU deduplication", len(unique_items))
+                return unique_items
+            
             # CRITICAL FIX: Deduplicate by SKU and aggregate quantities
             # ShipStation API returns same SKU across multiple warehouses/locations
-            sku_aggregated = {}
-            for item in final_items:
-                sku = item.get("sku")
-                if not sku:
-                    continue
-                    
-                if sku not in sku_aggregated:
-                    sku_aggregated[sku] = {
-                        "sku": sku,
-                        "on_hand": 0,
-                        "allocated": 0,
-                        "available": 0,
-                        "average_cost": item.get("average_cost"),
-                        "inventory_warehouse_id": item.get("inventory_warehouse_id"),
-                        "inventory_location_id": item.get("inventory_location_id")
-                    }
-                
-                # Aggregate quantities across all warehouse locations
-                sku_aggregated[sku]["on_hand"] += item.get("on_hand", 0)
-                sku_aggregated[sku]["allocated"] += item.get("allocated", 0) 
-                sku_aggregated[sku]["available"] += item.get("available", 0)
-            
-            # Convert back to list
-            deduplicated_items = list(sku_aggregated.values())
+            deduplicated_items = _aggregate_by_sku(final_items)
             
-            logger.info(f"Deduplicated from {len(final_items)} total items to {len(deduplicated_items)} unique SKUs")
+            logger.info("Deduplicated from %s total items to %s unique SKUs", len(final_items), len(deduplicated_items))
             return deduplicated_items
             
         except requests.exceptions.RequestException as e:
@@ -227,73 +295,101 @@ class ShipStationConnector(BaseConnector):
         except Exception as e:
             raise ShipStationAPIError(f"Unexpected error: {e}")
 
+    def _fetch_inventory_page(self, url: str, api_key: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Fetch a single page of inventory and return the decoded response body."""
+        response = self.session.get(
+            url,
+            headers={"API-Key": api_key},
+            params=params,
+            timeout=30
+        )
+        
+        # 429/5xx are retried by the session; anything left here is a hard error (e.g. auth)
+        if response.status_code != 200:
+            raise ShipStationAPIError(f"HTTP {response.status_code}: {response.text}")
+        
+        return decode_json(response)
+
     def _read_inventory_for_sku_list(self, sku_list: List[str], api_key: str, base_url: str) -> List[Dict[str, Any]]:
         """
         Read inventory from ShipStation for a specific list of SKUs.
         NOW ACCEPTS api_key and base_url directly.
+        
+        Each SKU needs its own request, so lookups are run concurrently on a
+        small thread pool sharing the connector's session.
         """
-        all_items = []
-        for sku in sku_list:
-            try:
-                params = {"sku": sku}
-                response = requests.get(
-                    f"{base_url}/v2/inventory",
-                    headers={"API-Key": api_key},
-                    params=params,
-                    timeout=15
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    inventory_items = data.get("inventory", [])
-                    if inventory_items:
-                        item = inventory_items[0] # Should only be one
-                        all_items.append({
-                            "sku": item.get("sku"),
-                            "on_hand": item.get("on_hand", 0),
-                            "allocated": item.get("allocated", 0),
-                            "available": item.get("available", 0),
-                            "average_cost": item.get("average_cost"),
-                            "inventory_warehouse_id": item.get("inventory_warehouse_id"),
-                            "inventory_location_id": item.get("inventory_location_id")
-                        })
-                    else:
-                        # No inventory record found, check if SKU exists as a product
-                        logger.info(f"No inventory record for SKU {sku}, checking if it exists as a product...")
-                        product_response = requests.get(
-                            f"{base_url}/v2/products",
-                            headers={"API-Key": api_key},
-                            params={"sku": sku},
-                            timeout=15
-                        )
-                        if product_response.status_code == 200:
-                            product_data = product_response.json()
-                            products = product_data.get("products", [])
-                            if products and products[0].get("active", False):
-                                # Product exists and is active, treat as zero inventory
-                                logger.info(f"SKU {sku} exists as active product but has no inventory. Setting to zero.")
-                                all_items.append({
-                                    "sku": sku,
-                                    "on_hand": 0,
-                                    "allocated": 0,
-                                    "available": 0,
-                                    "average_cost": None,
-                                    "inventory_warehouse_id": None,
-                                    "inventory_location_id": None
-                                })
-                            else:
-                                logger.warning(f"SKU {sku} either doesn't exist as a product or is inactive in ShipStation.")
-                        else:
-                            logger.error(f"Failed to check product for SKU {sku}: HTTP {product_response.status_code}")
+        with ThreadPoolExecutor(max_workers=SKU_LOOKUP_WORKERS) as executor:
+            results = executor.map(
+                lambda sku: self._read_inventory_for_sku(sku, api_key, base_url),
+                sku_list
+            )
+            # map() preserves the requested SKU order
+            all_items = [item for item in results if item is not None]
+        
+        logger.info("Successfully fetched inventory for %s out of %s requested SKUs.", len(all_items), len(sku_list))
+        return all_items
+    
+    def _read_inventory_for_sku(self, sku: str, api_key: str, base_url: str) -> Optional[Dict[str, Any]]:
+        """Read inventory for a single SKU, or None if it can't be found."""
+        try:
+            params = {"sku": sku}
+            response = self.session.get(
+                f"{base_url}/v2/inventory",
+                headers={"API-Key": api_key},
+                params=params,
+                timeout=15
+            )
+            if response.status_code == 200:
+                data = decode_json(response)
+                inventory_items = data.get("inventory", [])
+                if inventory_items:
+                    item = inventory_items[0] # Should only be one
+                    return {
+                        "sku": item.get("sku"),
+                        "on_hand": item.get("on_hand", 0),
+                        "allocated": item.get("allocated", 0),
+                        "available": item.get("available", 0),
+                        "average_cost": item.get("average_cost"),
+                        "inventory_warehouse_id": item.get("inventory_warehouse_id"),
+                        "inventory_location_id": item.get("inventory_location_id")
+                    }
                 else:
-                    logger.error(f"Failed to fetch SKU {sku}: HTTP {response.status_code} - {response.text}")
+                    # No inventory record found, check if SKU exists as a product
+                    logger.info("No inventory record for SKU %s, checking if it exists as a product...", sku)
+                    product_response = self.session.get(
+                        f"{base_url}/v2/products",
+                        headers={"API-Key": api_key},
+                        params={"sku": sku},
+                        timeout=15
+                    )
+                    if product_response.status_code == 200:
+                        product_data = decode_json(product_response)
+                        products = product_data.get("products", [])
+                        if products and products[0].get("active", False):
+                            # Product exists and is active, treat as zero inventory
+                            logger.info("SKU %s exists as active product but has no inventory. Setting to zero.", sku)
+                            return {
+                                "sku": sku,
+                                "on_hand": 0,
+                                "allocated": 0,
+                                "available": 0,
+                                "average_cost": None,
+                                "inventory_warehouse_id": None,
+                                "inventory_location_id": None
+                            }
+                        else:
+                            logger.warning("SKU %s either doesn't exist as a product or is inactive in ShipStation.", sku)
+                    else:
+                        logger.error("Failed to check product for SKU %s: HTTP %s", sku, product_response.status_code)
+            else:
+                logger.error("Failed to fetch SKU %s: HTTP %s - %s", sku, response.status_code, response.text)
 
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Request failed for SKU {sku}: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected error for SKU {sku}: {e}")
+        except requests.exceptions.RequestException as e:
+            logger.error("Request failed for SKU %s: %s", sku, e)
+        except Exception as e:
+            logger.error("Unexpected error for SKU %s: %s", sku, e)
         
-        logger.info(f"Successfully fetched inventory for {len(all_items)} out of {len(sku_list)} requested SKUs.")
-        return all_items
+        return None
     
     def _write_inventory(self, items: List[Dict[str, Any]]) -> Dict[str, Any]:
         """ShipStation connector is read-only for inventory."""
@@ -303,14 +399,14 @@ class ShipStationConnector(BaseConnector):
         """Find SKUs that were requested but not found in inventory."""
         found_skus = {item.get("sku") for item in found_inventory if item.get("sku")}
         missing_skus = [sku for sku in target_skus if sku not in found_skus]
-        logger.info(f"Found {len(missing_skus)} SKUs missing from inventory out of {len(target_skus)} requested")
+        logger.info("Found %s SKUs missing from inventory out of %s requested", len(missing_skus), len(target_skus))
         return missing_skus
 
     def _combine_inventory_data(self, actual_inventory: List[Dict[str, Any]], zero_inventory: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Combine actual inventory data with zero inventory items."""
         combined = actual_inventory.copy()
         combined.extend(zero_inventory)
-        logger.info(f"Combined {len(actual_inventory)} actual inventory items with {len(zero_inventory)} zero inventory items")
+        logger.info("Combined %s actual inventory items with %s zero inventory items", len(actual_inventory), len(zero_inventory))
         return combined
 
     def read_products(self, **filters) -> List[Dict[str, Any]]:
@@ -321,53 +417,73 @@ class ShipStationConnector(BaseConnector):
         - sku_list: List of specific SKUs to fetch
         - limit: Number of items to fetch
         - active: Filter by active status
+        
+        When the first page reports the total page count, the remaining pages
+        are fetched concurrently; otherwise pages are walked sequentially.
         """
         try:
             if "sku_list" in filters:
                 return self._read_products_for_sku_list(filters["sku_list"])
             
             # General product read (paginated)
-            all_products = []
-            page = 1
             limit = filters.get("limit")
             
-            while True:
-                params = {"page": page, "page_size": 100}
-                
-                # Add filters
-                if "active" in filters:
-                    params["active"] = filters["active"]
-                
-                response = requests.get(
-                    f"{self.base_url}/v2/products",
-                    headers={"API-Key": self.credentials["api_key"]},
-                    params=params,
-                    timeout=30
-                )
-                
-                if response.status_code != 200:
-                    raise ShipStationAPIError(f"HTTP {response.status_code}: {response.text}")
-                
-                data = response.json()
-                products = data.get("products", [])
-                
-                if not products:
-                    break
-                
-                all_products.extend(products)
-                
-                # Check if we've reached the limit
-                if limit and len(all_products) >= limit:
-                    break
-                
-                # Check if we've reached the last page
-                if len(products) < 100:  # Less than page size means last page
-                    break
+            data = self._fetch_products_page(1, filters)
+            all_products = data.get("products", [])
+            total_pages = data.get("pages")
+            
+            has_more = all_products and not (limit and len(all_products) >= limit)
+            
+            walk_pages = False
+            if has_more and isinstance(total_pages, int):
+                # Only request as many pages as the limit can use
+                last_page = total_pages
+                if limit:
+                    last_page = min(last_page, -(-limit // PRODUCTS_PAGE_SIZE))
                 
-                page += 1
+                if last_page > 1:
+                    with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+                        # map() preserves page order
+                        responses = list(executor.map(
+                            lambda page: self._fetch_products_page(page, filters),
+                            range(2, last_page + 1)
+                        ))
+                    # A response for the wrong page would duplicate or drop products
+                    if all(page_data.get("page") == page for page, page_data in zip(range(2, last_page + 1), responses)):
+                        for page_data in responses:
+                            all_products.extend(page_data.get("products", []))
+                    else:
+                        logger.warning("ShipStation returned unexpected product pages, falling back to sequential paging")
+                        walk_pages = True
+            elif has_more and len(all_products) >= PRODUCTS_PAGE_SIZE:
+                walk_pages = True
+            
+            if walk_pages:
+                # Walk pages one at a time until a short one
+                page = 2
+                while True:
+                    page_data = self._fetch_products_page(page, filters)
+                    if page_data.get("page", page) != page:
+                        raise ShipStationAPIError(f"Requested products page {page} but received page {page_data.get('page')}")
+                    products = page_data.get("products", [])
+                    
+                    if not products:
+                        break
+                    
+                    all_products.extend(products)
+                    
+                    # Check if we've reached the limit
+                    if limit and len(all_products) >= limit:
+                        break
+                    
+                    # Check if we've reached the last page
+                    if len(products) < PRODUCTS_PAGE_SIZE:  # Less than page size means last page
+                        break
+                    
+                    page += 1
             
             final_products = all_products[:limit] if limit else all_products
-            logger.info(f"Successfully fetched {len(final_products)} products from ShipStation")
+            logger.info("Successfully fetched %s products from ShipStation", len(final_products))
             return final_products
             
         except requests.exceptions.RequestException as e:
@@ -375,6 +491,26 @@ class ShipStationConnector(BaseConnector):
         except Exception as e:
             raise ShipStationAPIError(f"Unexpected error: {e}")
 
+    def _fetch_products_page(self, page: int, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch a single page of products and return the decoded response body."""
+        params = {"page": page, "page_size": PRODUCTS_PAGE_SIZE}
+        
+        # Add filters
+        if "active" in filters:
+            params["active"] = filters["active"]
+        
+        response = self.session.get(
+            f"{self.base_url}/v2/products",
+            headers={"API-Key": self.credentials["api_key"]},
+            params=params,
+            timeout=30
+        )
+        
+        if response.status_code != 200:
+            raise ShipStationAPIError(f"HTTP {response.status_code}: {response.text}")
+        
+        return decode_json(response)
+
     def _read_products_for_sku_list(self, sku_list: List[str]) -> List[Dict[str, Any]]:
         """Fetch products for a specific list of SKUs."""
         all_products = []
@@ -382,7 +518,7 @@ class ShipStationConnector(BaseConnector):
         for sku in sku_list:
             try:
                 params = {"sku": sku}
-                response = requests.get(
+                response = self.session.get(
                     f"{self.base_url}/v2/products",
                     headers={"API-Key": self.credentials["api_key"]},
                     params=params,
@@ -390,18 +526,18 @@ class ShipStationConnector(BaseConnector):
                 )
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = decode_json(response)
                     products = data.get("products", [])
                     all_products.extend(products)
                 else:
-                    logger.warning(f"Failed to fetch product for SKU {sku}: HTTP {response.status_code}")
+                    logger.warning("Failed to fetch product for SKU %s: HTTP %s", sku, response.status_code)
                     
             except requests.exceptions.RequestException as e:
-                logger.error(f"Request failed for SKU {sku}: {e}")
+                logger.error("Request failed for SKU %s: %s", sku, e)
             except Exception as e:
-                logger.error(f"Unexpected error for SKU {sku}: {e}")
+                logger.error("Unexpected error for SKU %s: %s", sku, e)
         
-        logger.info(f"Successfully fetched {len(all_products)} products for {len(sku_list)} requested SKUs")
+        logger.info("Successfully fetched %s products for %s requested SKUs", len(all_products), len(sku_list))
         return all_products
 
 
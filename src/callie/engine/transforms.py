@@ -3,10 +3,59 @@ Field transformation utilities for mapping data between services.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Transforms looked up by exact name
+_TRANSFORMS: Dict[str, Callable[[Any], Any]] = {
+    "round": lambda value: round(float(value)),
+    "round_to_cents": lambda value: round(float(value), 2),
+    "uppercase": lambda value: str(value).upper(),
+    "lowercase": lambda value: str(value).lower(),
+    "string": str,
+    "int": lambda value: int(float(value)),
+    "float": float,
+}
+
+# Parameterised transforms, e.g. "multiply_by_2.5", checked in order
+_PARAM_TRANSFORMS = (
+    ("multiply_by_", operator.mul),
+    ("divide_by_", operator.truediv),
+    ("add_", operator.add),
+    ("subtract_", operator.sub),
+)
+
+
+@lru_cache(maxsize=256)
+def _resolve_transform(transform: str) -> Optional[Callable[[Any], Any]]:
+    """
+    Resolve a transform name to a callable, or None if it is unknown.
+    
+    Parameterised transforms are parsed once per distinct name and cached.
+    """
+    transform_fn = _TRANSFORMS.get(transform)
+    if transform_fn is not None:
+        return transform_fn
+    
+    for prefix, op in _PARAM_TRANSFORMS:
+        if transform.startswith(prefix):
+            try:
+                operand = float(transform[len(prefix):])
+            except ValueError as e:
+                # Surface the bad parameter as a per-value transform failure
+                message = str(e)
+                
+                def invalid_transform(value: Any) -> Any:
+                    raise ValueError(message)
+                
+                return invalid_transform
+            return lambda value: op(float(value), operand)
+    
+    return None
+
 
 class FieldTransformer:
     """
@@ -28,78 +77,95 @@ class FieldTransformer:
         if not transform or value is None:
             return value
         
+        transform_fn = _resolve_transform(transform)
+        if transform_fn is None:
+            logger.warning(f"Unknown transform: {transform}")
+            return value
+        
         try:
-            if transform == "round":
-                return round(float(value))
-            elif transform == "round_to_cents":
-                return round(float(value), 2)
-            elif transform == "uppercase":
-                return str(value).upper()
-            elif transform == "lowercase":
-                return str(value).lower()
-            elif transform == "string":
-                return str(value)
-            elif transform == "int":
-                return int(float(value))
-            elif transform == "float":
-                return float(value)
-            elif transform.startswith("multiply_by_"):
-                multiplier = float(transform.replace("multiply_by_", ""))
-                return float(value) * multiplier
-            elif transform.startswith("divide_by_"):
-                divisor = float(transform.replace("divide_by_", ""))
-                return float(value) / divisor
-            elif transform.startswith("add_"):
-                addend = float(transform.replace("add_", ""))
-                return float(value) + addend
-            elif transform.startswith("subtract_"):
-                subtrahend = float(transform.replace("subtract_", ""))
-                return float(value) - subtrahend
-            else:
-                logger.warning(f"Unknown transform: {transform}")
-                return value
-                
+            return transform_fn(value)
         except (ValueError, TypeError, ZeroDivisionError) as e:
             logger.error(f"Transform '{transform}' failed for value '{value}': {e}")
             return value
     
     @staticmethod
-    def map_fields(source_data: Dict[str, Any], field_mappings: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def compile_mappings(field_mappings: List[Dict[str, Any]]) -> List[Tuple[str, str, Optional[str], bool]]:
         """
-        Map fields from source format to target format.
+        Validate field mappings once so they can be applied to many items.
         
         Args:
-            source_data: Data from source service
             field_mappings: List of field mapping configurations
             
         Returns:
-            Mapped data in target format
+            List of (source_field, target_field, transform, required) tuples
         """
-        target_data = {}
+        compiled = []
         
         for mapping in field_mappings:
             source_field = mapping.get("source_field")
             target_field = mapping.get("target_field")
-            transform = mapping.get("transform")
-            required = mapping.get("required", True)
             
             if not source_field or not target_field:
                 logger.warning(f"Invalid mapping: {mapping}")
                 continue
             
-            # Get value from source
-            source_value = source_data.get(source_field)
+            compiled.append((source_field, target_field, mapping.get("transform"), mapping.get("required", True)))
+        
+        return compiled
+    
+    @staticmethod
+    def map_fields(source_data: Dict[str, Any], field_mappings: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Map fields from source format to target format.
+        
+        Args:
+            source_data: Data from source service
+            field_mappings: List of field mapping configurations
             
+        Returns:
+            Mapped data in target format
+        """
+        return FieldTransformer._map_compiled(source_data, FieldTransformer.compile_mappings(field_mappings))
+    
+    @staticmethod
+    def _make_getter(compiled_mappings: List[Tuple[str, str, Optional[str], bool]]) -> Optional[Callable[[Dict[str, Any]], Tuple[Any, ...]]]:
+        """Build a getter that fetches every source field of an item in one C-level call."""
+        source_fields = [source_field for source_field, _, _, _ in compiled_mappings]
+        if not source_fields:
+            return None
+        if len(source_fields) == 1:
+            # itemgetter with a single key returns the bare value, not a tuple
+            single_getter = operator.itemgetter(source_fields[0])
+            return lambda item: (single_getter(item),)
+        return operator.itemgetter(*source_fields)
+    
+    @staticmethod
+    def _map_compiled(
+        source_data: Dict[str, Any],
+        compiled_mappings: List[Tuple[str, str, Optional[str], bool]],
+        getter: Optional[Callable[[Dict[str, Any]], Tuple[Any, ...]]] = None
+    ) -> Dict[str, Any]:
+        """Map a single item using mappings prepared by compile_mappings."""
+        source_values = None
+        if getter is not None:
+            try:
+                source_values = getter(source_data)
+            except KeyError:
+                # Some source field is absent; fall back to per-field lookups
+                pass
+        if source_values is None:
+            source_values = [source_data.get(source_field) for source_field, _, _, _ in compiled_mappings]
+        
+        target_data = {}
+        
+        for (source_field, target_field, transform, required), source_value in zip(compiled_mappings, source_values):
             # Check if required field is missing
             if required and source_value is None:
                 logger.warning(f"Required field '{source_field}' not found in source data")
                 continue
             
-            # Apply transformation
-            transformed_value = FieldTransformer.apply_transform(source_value, transform)
-            
-            # Set in target
-            target_data[target_field] = transformed_value
+            # Apply transformation and set in target
+            target_data[target_field] = FieldTransformer.apply_transform(source_value, transform)
             
         return target_data
     
@@ -108,6 +174,8 @@ class FieldTransformer:
         """
         Map a list of items from source to target format.
         
+        The mappings are compiled once and reused for every item.
+        
         Args:
             source_items: List of items from source service
             field_mappings: List of field mapping configurations
@@ -115,7 +183,9 @@ class FieldTransformer:
         Returns:
             List of mapped items in target format
         """
+        compiled_mappings = FieldTransformer.compile_mappings(field_mappings)
+        getter = FieldTransformer._make_getter(compiled_mappings)
         return [
-            FieldTransformer.map_fields(item, field_mappings)
+            FieldTransformer._map_compiled(item, compiled_mappings, getter)
             for item in source_items
-        ] 
\ No newline at end of file
+        ]
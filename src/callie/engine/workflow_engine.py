@@ -6,10 +6,15 @@ dynamically and passing data between stages based on configuration.
 """
 
 import logging
+import re
 import time
 import inspect
-from datetime import datetime
-from typing import Dict, List, Any, Optional, Type, Union
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import timedelta
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Any, NamedTuple, Optional, Set, Tuple, Type, Union, TYPE_CHECKING
 import os
 import asyncio
 
@@ -17,13 +22,86 @@ from ..models.stages import (
     WorkflowConfig, WorkflowExecution, StageConfig, StageResult,
     StageType, StageErrorStrategy
 )
-from ..connectors.base import BaseConnector
-from ..connectors.shipstation import ShipStationConnector
+from ..connectors.base import BaseConnector, build_http_session
+from ..connectors.shipstation import ShipStationConnector, PAGE_FETCH_WORKERS, SKU_LOOKUP_WORKERS
 from ..connectors.infiplex import InfiPlexConnector
-from ..services.secrets import SecretManagerService
+
+if TYPE_CHECKING:
+    # Imported lazily at runtime: it pulls in the Secret Manager client library
+    from ..services.secrets import SecretManagerService
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on stages that run concurrently within one workflow execution
+MAX_PARALLEL_STAGES = 8
+
+# Upper bound on concurrent method calls against one connector; each call may
+# already fan out its own HTTP requests, and the upstream APIs are rate limited
+MAX_CONCURRENT_CONNECTOR_CALLS = 2
+
+# Connections kept per host by the engine's shared HTTP session: enough for every
+# concurrent call on a connector to fan out fully
+HTTP_POOL_MAXSIZE = MAX_CONCURRENT_CONNECTOR_CALLS * max(PAGE_FETCH_WORKERS, SKU_LOOKUP_WORKERS)
+
+# How long loaded integration credentials are reused before Secret Manager is asked again
+INTEGRATION_CONFIG_TTL_SECONDS = float(os.getenv("INTEGRATION_CONFIG_TTL_SECONDS", "300"))
+
+# Secret Manager entries holding the connector credentials
+INTEGRATION_SECRET_NAMES = (
+    "shipstation-api-key",
+    "shipstation-base-url",
+    "infiplex-api-key",
+    "infiplex-base-url",
+)
+
+# Log stage placeholders: {variable} or {len(variable)}
+_PLACEHOLDER_RE = re.compile(r"\{(?:len\(([^{}()]+)\)|([^{}()]+))\}")
+
+
+@lru_cache(maxsize=256)
+def _parse_log_template(message: str) -> Tuple[Tuple[str, Optional[str], Optional[str], str], ...]:
+    """Split a log message into (literal, len_name, name, placeholder) segments.
+
+    Log messages are fixed per stage, so each one is parsed only once.
+    """
+    segments = []
+    position = 0
+    for match in _PLACEHOLDER_RE.finditer(message):
+        len_name, name = match.groups()
+        segments.append((message[position:match.start()], len_name, name, match.group(0)))
+        position = match.end()
+    segments.append((message[position:], None, None, ""))
+    return tuple(segments)
+
+
+# Integration whose credentials are injected for each connector role
+_ROLE_SERVICE_TYPES = {"source": "shipstation", "target": "infiplex"}
+
+# Integration config keys injected into connector methods that name them as parameters
+_CREDENTIAL_KEYS = ("api_key", "base_url")
+
+
+class MethodSignature(NamedTuple):
+    """Parameter names of a connector method, whether it accepts **kwargs, and which credentials it takes."""
+    parameters: FrozenSet[str]
+    accepts_kwargs: bool
+    credential_keys: Tuple[str, ...]
+
+
+@lru_cache(maxsize=512)
+def _method_signature(func) -> MethodSignature:
+    """Inspect a connector method once; signatures are fixed per function."""
+    sig = inspect.signature(func)
+    return MethodSignature(
+        # Keyed on the unbound function, so drop the instance parameter
+        parameters=frozenset(sig.parameters) - {"self"},
+        accepts_kwargs=any(
+            param.kind == inspect.Parameter.VAR_KEYWORD
+            for param in sig.parameters.values()
+        ),
+        credential_keys=tuple(key for key in _CREDENTIAL_KEYS if key in sig.parameters),
+    )
+
 
 class WorkflowExecutionContext:
     """Context that maintains state during workflow execution."""
@@ -32,18 +110,36 @@ class WorkflowExecutionContext:
         self.workflow = workflow
         self.variables: Dict[str, Any] = workflow.variables.copy()
         self.stage_results: List[StageResult] = []
+        self.completed_stage_ids: Set[str] = set()
         self.connectors: Dict[str, BaseConnector] = {}
+        self.connector_methods: Dict[Tuple[str, str], Any] = {}
+        self.connector_limits: Dict[str, threading.Semaphore] = {}
+        # variable name -> (list the set was built from, its membership set)
+        self._filter_sets: Dict[str, Tuple[Any, FrozenSet[Any]]] = {}
         self.execution: Optional[WorkflowExecution] = None
+        # Independent stages run on worker threads and share these variables
+        self._lock = threading.Lock()
 
     def set_variable(self, name: str, value: Any):
         """Set a variable in the context."""
-        self.variables[name] = value
-        logger.debug(f"Set variable {name} = {type(value).__name__}")
+        with self._lock:
+            self.variables[name] = value
+            self._filter_sets.pop(name, None)
+        logger.debug("Set variable %s = %s", name, type(value).__name__)
 
     def get_variable(self, name: str, default: Any = None) -> Any:
         """Get a variable from the context."""
         return self.variables.get(name, default)
 
+    def get_filter_set(self, name: str, values: List[Any]) -> FrozenSet[Any]:
+        """Get a membership set for a list variable, reusing it across filter stages."""
+        cached = self._filter_sets.get(name)
+        if cached is not None and cached[0] is values:
+            return cached[1]
+        filter_set = frozenset(values)
+        self._filter_sets[name] = (values, filter_set)
+        return filter_set
+
     def get_connector(self, name: str) -> BaseConnector:
         """Get a connector instance."""
         if name not in self.connectors:
@@ -54,57 +150,102 @@ class WorkflowExecutionContext:
 class WorkflowEngine:
     """Executes configurable stage-based workflows."""
 
-    def __init__(self, secret_service: Optional[SecretManagerService] = None):
+    def __init__(self, secret_service: Optional["SecretManagerService"] = None):
         self.connector_classes = {
             "shipstation": ShipStationConnector,
             "infiplex": InfiPlexConnector
         }
         self.integration_configs: Dict[str, Dict[str, Any]] = {}
+        # One keep-alive pool shared by every connector this engine creates
+        self.http_session = build_http_session(pool_maxsize=HTTP_POOL_MAXSIZE)
+        # Idle connector instances by class. Each execution checks out its own and
+        # returns them when it finishes, so overlapping runs never share one.
+        self._idle_connectors: Dict[type, List[BaseConnector]] = {}
+        self._idle_connectors_lock = threading.Lock()
+        self._configs_loaded_at: Optional[float] = None
+        self._configs_lock = threading.Lock()
         if secret_service:
             self.secret_service = secret_service
         else:
             # Fallback for older initialization paths, though app.py now provides it
             project_id = os.getenv("GOOGLE_CLOUD_PROJECT")
             if project_id:
+                from ..services.secrets import SecretManagerService
                 self.secret_service = SecretManagerService(project_id=project_id)
             else:
                 logger.warning("WorkflowEngine initialized without a SecretManagerService and no GOOGLE_CLOUD_PROJECT set.")
                 self.secret_service = None
 
-    def load_integration_configs(self):
-        """Load integration configurations from Secret Manager using known secret names."""
+        self._stage_dispatch = {
+            StageType.CONNECTOR_METHOD: self._execute_connector_method,
+            StageType.TRANSFORM: self._execute_transform,
+            StageType.FILTER: self._execute_filter,
+            StageType.MAP_FIELDS: self._execute_map_fields,
+            StageType.SET_VARIABLE: self._execute_set_variable,
+            StageType.LOG: self._execute_log,
+        }
+        self._transform_dispatch = {
+            "extract_field": self._transform_extract_field,
+            "filter_field": self._transform_filter_field,
+            "add_field": self._transform_add_field,
+            "slice": self._transform_slice,
+        }
+        self._condition_dispatch = {
+            "exists": self._condition_exists,
+        }
+
+    def load_integration_configs(self, force: bool = False):
+        """Load integration configurations from Secret Manager using known secret names.
+
+        Loaded configs are reused for INTEGRATION_CONFIG_TTL_SECONDS; pass force=True to reload now.
+        """
         if not self.secret_service:
             logger.warning("SecretManagerService not available, skipping integration config loading.")
             return
 
+        with self._configs_lock:
+            if not force and self._configs_loaded_at is not None and time.monotonic() - self._configs_loaded_at < INTEGRATION_CONFIG_TTL_SECONDS:
+                return
+            if self._configs_loaded_at is not None or force:
+                # Stale or forced: drop the secret cache so rotated credentials are picked up
+                self.secret_service.clear_cache()
+            self._load_integration_configs()
+
+    def _load_integration_configs(self):
+        """Fetch integration credentials from Secret Manager into integration_configs."""
         logger.info("Loading integration configurations from Secret Manager...")
         try:
+            # Each secret is a separate Secret Manager round-trip; issue them together
+            with ThreadPoolExecutor(max_workers=len(INTEGRATION_SECRET_NAMES)) as executor:
+                secrets = {name: executor.submit(self.secret_service.get_secret, name) for name in INTEGRATION_SECRET_NAMES}
+
             # Load ShipStation credentials
-            shipstation_api_key = self.secret_service.get_secret("shipstation-api-key")
-            shipstation_base_url = self.secret_service.get_secret("shipstation-base-url")
+            shipstation_api_key = secrets["shipstation-api-key"].result()
+            shipstation_base_url = secrets["shipstation-base-url"].result()
             self.integration_configs["shipstation"] = {
                 "api_key": shipstation_api_key,
                 "base_url": shipstation_base_url
             }
-            logger.info(f"Loaded ShipStation integration config: api_key={'*' * len(shipstation_api_key) if shipstation_api_key else 'None'}, base_url={shipstation_base_url}")
+            logger.info("Loaded ShipStation integration config: api_key=%s, base_url=%s", '*' * len(shipstation_api_key) if shipstation_api_key else 'None', shipstation_base_url)
 
             # Load InfiPlex credentials (default warehouse 17)
-            infiplex_api_key = self.secret_service.get_secret("infiplex-api-key")
-            infiplex_base_url = self.secret_service.get_secret("infiplex-base-url")
+            infiplex_api_key = secrets["infiplex-api-key"].result()
+            infiplex_base_url = secrets["infiplex-base-url"].result()
             self.integration_configs["infiplex"] = {
                 "api_key": infiplex_api_key,
                 "base_url": infiplex_base_url
             }
-            logger.info(f"Loaded InfiPlex integration config: api_key={'*' * len(infiplex_api_key) if infiplex_api_key else 'None'}, base_url={infiplex_base_url}")
+            logger.info("Loaded InfiPlex integration config: api_key=%s, base_url=%s", '*' * len(infiplex_api_key) if infiplex_api_key else 'None', infiplex_base_url)
 
-            logger.info(f"Successfully loaded {len(self.integration_configs)} integration configurations.")
+            logger.info("Successfully loaded %d integration configurations.", len(self.integration_configs))
+            self._configs_loaded_at = time.monotonic()
         except Exception as e:
-            logger.error(f"Failed to load integration configurations: {e}")
+            logger.error("Failed to load integration configurations: %s", e)
             # Don't raise - let the workflow continue and individual stages can handle missing credentials
 
     def execute_workflow(self, workflow: WorkflowConfig, triggered_by: str = "manual", initial_variables: Optional[Dict[str, Any]] = None) -> WorkflowExecution:
         """Execute a complete workflow."""
-        # Load integration configs before execution
+        # Load integration configs before execution (no-op while the cached configs are fresh)
         self.load_integration_configs()
         
         execution_id = f"workflow_{workflow.id}_{int(time.time())}"
@@ -112,10 +253,13 @@ class WorkflowEngine:
             id=execution_id,
             workflow_id=workflow.id,
             triggered_by=triggered_by,
-            total_stages=len([s for s in workflow.stages if s.enabled])
+            total_stages=sum(1 for s in workflow.stages if s.enabled)
         )
 
-        logger.info(f"Starting workflow execution: {execution_id}")
+        # Durations come from the monotonic clock; wall-clock time is read only once
+        start_perf = time.perf_counter()
+
+        logger.info("Starting workflow execution: %s", execution_id)
 
         try:
             context = WorkflowExecutionContext(workflow)
@@ -125,151 +269,249 @@ class WorkflowEngine:
             # Initialize connectors
             self._initialize_connectors(workflow, context)
 
-            # Execute stages in order
-            for stage in workflow.stages:
-                if not stage.enabled:
-                    logger.info(f"Skipping disabled stage: {stage.id}")
-                    continue
-
-                # Check dependencies
-                if not self._check_dependencies(stage, context):
-                    logger.warning(f"Dependencies not met for stage: {stage.id}")
-                    continue
-
-                # Execute stage
-                stage_result = self._execute_stage(stage, context)
-                execution.stage_results.append(stage_result)
-                context.stage_results.append(stage_result)
-
-                # Update execution counts
-                if stage_result.status == "success":
-                    execution.completed_stages += 1
-                elif stage_result.status == "failed":
-                    execution.failed_stages += 1
-                    if stage.error_strategy == StageErrorStrategy.FAIL:
-                        execution.status = "failed"
-                        execution.error_message = stage_result.error_message
-                        break
-                elif stage_result.status == "skipped":
-                    execution.skipped_stages += 1
+            # Execute stages as a DAG so independent branches run concurrently
+            self._execute_stages(workflow, context, execution)
 
             # Mark as completed if we didn't fail
             if execution.status == "running":
                 execution.status = "completed"
 
         except Exception as e:
-            logger.error(f"Workflow execution failed: {e}")
+            logger.error("Workflow execution failed: %s", e)
             execution.status = "failed"
             execution.error_message = str(e)
 
         finally:
-            execution.completed_at = datetime.utcnow()
-            if execution.started_at:
-                execution.execution_time_seconds = (
-                    execution.completed_at - execution.started_at
-                ).total_seconds()
+            execution.execution_time_seconds = time.perf_counter() - start_perf
+            execution.completed_at = execution.started_at + timedelta(seconds=execution.execution_time_seconds)
 
             # Store execution in context for potential access
             context.execution = execution
+            self._release_connectors(context)
 
-        logger.info(f"Workflow execution completed: {execution_id} - Status: {execution.status}")
+        logger.info("Workflow execution completed: %s - Status: %s", execution_id, execution.status)
         return execution
 
+    async def execute_workflow_async(self, workflow: WorkflowConfig, triggered_by: str = "manual", initial_variables: Optional[Dict[str, Any]] = None) -> WorkflowExecution:
+        """Execute a workflow without blocking the calling event loop."""
+        return await asyncio.to_thread(self.execute_workflow, workflow, triggered_by, initial_variables)
+
+    def _execute_stages(self, workflow: WorkflowConfig, context: WorkflowExecutionContext, execution: WorkflowExecution):
+        """Run enabled stages once their predecessors finish, in parallel where possible."""
+        stages = []
+        for stage in workflow.stages:
+            if not stage.enabled:
+                logger.info("Skipping disabled stage: %s", stage.id)
+                continue
+            stages.append(stage)
+
+        if not stages:
+            return
+
+        predecessors = self._build_stage_graph(stages)
+        dependents: List[List[int]] = [[] for _ in stages]
+        for index, preds in enumerate(predecessors):
+            for pred in preds:
+                dependents[pred].append(index)
+        pending = [len(preds) for preds in predecessors]
+        ready = deque(index for index, count in enumerate(pending) if count == 0)
+
+        def release(index: int):
+            for dependent in dependents[index]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        running = {}
+        failed = False
+        results: Dict[int, StageResult] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=min(len(stages), MAX_PARALLEL_STAGES)) as executor:
+                while ready or running:
+                    while ready and not failed:
+                        index = ready.popleft()
+                        stage = stages[index]
+                        if not self._check_dependencies(stage, context):
+                            logger.warning("Dependencies not met for stage: %s", stage.id)
+                            release(index)
+                            continue
+                        running[executor.submit(self._execute_stage, stage, context)] = index
+
+                    if not running:
+                        break
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        index = running.pop(future)
+                        stage = stages[index]
+                        stage_result = results[index] = future.result()
+
+                        # Update execution counts
+                        if stage_result.status == "success":
+                            execution.completed_stages += 1
+                            context.completed_stage_ids.add(stage.id)
+                        elif stage_result.status == "failed":
+                            execution.failed_stages += 1
+                            if stage.error_strategy == StageErrorStrategy.FAIL and not failed:
+                                # Stop scheduling; stages already running are allowed to finish
+                                failed = True
+                                execution.status = "failed"
+                                execution.error_message = stage_result.error_message
+                        elif stage_result.status == "skipped":
+                            execution.skipped_stages += 1
+
+                        release(index)
+        finally:
+            # Report results in workflow order, not the order stages happened to finish
+            for index in sorted(results):
+                execution.stage_results.append(results[index])
+                context.stage_results.append(results[index])
+
+    def _build_stage_graph(self, stages: List[StageConfig]) -> List[Set[int]]:
+        """Compute the predecessors of each stage.
+
+        A stage waits for the earlier stages named in its depends_on and for
+        earlier stages that write a variable it reads (or read/write one it
+        writes). Stages with no such relationship may run concurrently, so
+        ordering between side-effecting connector calls must be declared with
+        depends_on. A depends_on naming a later enabled stage is rejected, since
+        whether it had finished would depend on scheduling.
+        """
+        positions = {stage.id: index for index, stage in enumerate(stages)}
+        predecessors: List[Set[int]] = []
+        seen: List[Tuple[str, Set[str], Set[str]]] = []
+        for position, stage in enumerate(stages):
+            for dependency in stage.depends_on:
+                if positions.get(dependency, -1) >= position:
+                    raise ValueError(f"Stage {stage.id}: depends_on '{dependency}' must refer to an earlier stage")
+
+            reads, writes = self._stage_variables(stage)
+            if stage.type == StageType.LOG:
+                reads.update(
+                    len_name or name
+                    for _, len_name, name, placeholder in _parse_log_template(stage.parameters.get("message", ""))
+                    if placeholder
+                )
+
+            preds = set()
+            for index, (stage_id, earlier_reads, earlier_writes) in enumerate(seen):
+                if (
+                    stage_id in stage.depends_on
+                    or reads & earlier_writes
+                    or writes & (earlier_reads | earlier_writes)
+                ):
+                    preds.add(index)
+            predecessors.append(preds)
+            seen.append((stage.id, reads, writes))
+
+        return predecessors
+
+    def _stage_variables(self, stage: StageConfig) -> Tuple[Set[str], Set[str]]:
+        """Return the context variables a stage reads and writes."""
+        reads = set(stage.input_variables)
+        value_from_variable = stage.parameters.get("value_from_variable")
+        if value_from_variable:
+            reads.add(value_from_variable)
+        if stage.condition and stage.condition.startswith("exists:"):
+            reads.add(stage.condition[7:])
+
+        writes = set()
+        if stage.output_variable:
+            writes.add(stage.output_variable)
+        if stage.type == StageType.SET_VARIABLE and stage.parameters.get("variable_name"):
+            writes.add(stage.parameters["variable_name"])
+
+        return reads, writes
+
     def _execute_stage(self, stage: StageConfig, context: WorkflowExecutionContext) -> StageResult:
         """Execute a single stage."""
-        logger.info(f"Executing stage: {stage.id} ({stage.type})")
+        logger.info("Executing stage: %s (%s)", stage.id, stage.type)
 
-        try:
-            result = StageResult(stage_id=stage.id, status="running")
-            logger.info(f"Created StageResult for {stage.id}: {result}")
-        except Exception as e:
-            logger.error(f"Failed to create StageResult for {stage.id}: {e}")
-            raise
+        result = StageResult(stage_id=stage.id, status="running")
 
+        start_perf = time.perf_counter()
         try:
             # Check condition if specified
             if stage.condition and not self._evaluate_condition(stage.condition, context):
                 result.status = "skipped"
-                result.completed_at = datetime.utcnow()
                 return result
 
-            # Execute based on stage type
-            if stage.type == StageType.CONNECTOR_METHOD:
-                output_data = self._execute_connector_method(stage, context)
-            elif stage.type == StageType.TRANSFORM:
-                output_data = self._execute_transform(stage, context)
-            elif stage.type == StageType.FILTER:
-                output_data = self._execute_filter(stage, context)
-            elif stage.type == StageType.MAP_FIELDS:
-                output_data = self._execute_map_fields(stage, context)
-            elif stage.type == StageType.SET_VARIABLE:
-                output_data = self._execute_set_variable(stage, context)
-            elif stage.type == StageType.LOG:
-                output_data = self._execute_log(stage, context)
-            else:
-                raise ValueError(f"Unknown stage type: {stage.type}")
-
-            # Store output in variable if specified
-            if stage.output_variable and output_data is not None:
-                context.set_variable(stage.output_variable, output_data)
-
-            result.output_data = output_data
-            result.status = "success"
-
-            if isinstance(output_data, list):
-                result.items_processed = len(output_data)
-            elif isinstance(output_data, dict) and "items" in output_data:
-                result.items_processed = len(output_data["items"])
-
-        except Exception as e:
-            logger.error(f"Stage {stage.id} failed: {e}")
-            result.status = "failed"
-            result.error_message = str(e)
-
-            # Handle retries
-            if stage.error_strategy == StageErrorStrategy.RETRY and result.retry_count < stage.retry_count:
-                logger.info(f"Retrying stage {stage.id} (attempt {result.retry_count + 1})")
-                time.sleep(stage.retry_delay)
-                result.retry_count += 1
-                return self._execute_stage(stage, context)  # Recursive retry
+            # Retries reuse the same StageResult so timing covers every attempt
+            while True:
+                try:
+                    # Execute based on stage type
+                    handler = self._stage_dispatch.get(stage.type)
+                    if handler is None:
+                        raise ValueError(f"Unknown stage type: {stage.type}")
+                    output_data = handler(stage, context)
+                except Exception as e:
+                    logger.error("Stage %s failed: %s", stage.id, e)
+                    result.status = "failed"
+                    result.error_message = str(e)
+
+                    # Handle retries
+                    if stage.error_strategy == StageErrorStrategy.RETRY and result.retry_count < stage.retry_count:
+                        logger.info("Retrying stage %s (attempt %d)", stage.id, result.retry_count + 1)
+                        time.sleep(stage.retry_delay)
+                        result.retry_count += 1
+                        continue
+                    break
+
+                # Store output in variable if specified
+                if stage.output_variable and output_data is not None:
+                    context.set_variable(stage.output_variable, output_data)
+
+                result.output_data = output_data
+                result.status = "success"
+                result.error_message = None
+
+                # Lists count their items; result dicts count their "items" entry
+                try:
+                    result.items_processed = len(output_data if isinstance(output_data, list) else output_data["items"])
+                except (TypeError, KeyError):
+                    pass
+                break
 
         finally:
-            result.completed_at = datetime.utcnow()
-            if result.started_at:
-                result.execution_time_seconds = (
-                    result.completed_at - result.started_at
-                ).total_seconds()
+            # Same scheme as execute_workflow: monotonic duration, single wall-clock read
+            result.execution_time_seconds = time.perf_counter() - start_perf
+            result.completed_at = result.started_at + timedelta(seconds=result.execution_time_seconds)
 
-        logger.info(f"Returning StageResult for {stage.id}: {result}")
+        logger.debug("Returning StageResult for %s: %s", stage.id, result.status)
         return result
 
     def _initialize_connectors(self, workflow: WorkflowConfig, context: WorkflowExecutionContext):
         """Initialize basic connector instances without credentials."""
-        # Initialize source connector (basic instance)
-        source_config = workflow.source
-        source_type = source_config.get("service_type")
-        if source_type in self.connector_classes:
-            connector_class = self.connector_classes[source_type]
-            # Create basic connector without credentials - credentials handled per-stage
-            context.connectors["source"] = connector_class()
-
-        # Initialize target connector (basic instance)
-        target_config = workflow.target
-        target_type = target_config.get("service_type")
-        if target_type in self.connector_classes:
-            connector_class = self.connector_classes[target_type]
-            # Create basic connector without credentials - credentials handled per-stage
-            context.connectors["target"] = connector_class()
-
-        logger.info(f"Initialized basic connectors: {list(context.connectors.keys())}")
+        self._initialize_connector("source", workflow.source, context)
+        self._initialize_connector("target", workflow.target, context)
+
+        logger.info("Initialized basic connectors: %s", list(context.connectors.keys()))
+
+    def _initialize_connector(self, role: str, connector_config: Dict[str, Any], context: WorkflowExecutionContext):
+        """Attach the connector for one role (source/target) if its service type is known."""
+        service_type = connector_config.get("service_type")
+        connector_class = self.connector_classes.get(service_type)
+        if connector_class:
+            with self._idle_connectors_lock:
+                idle = self._idle_connectors.get(connector_class)
+                connector = idle.pop() if idle else None
+            if connector is None:
+                # Create basic connector without credentials - credentials handled per-stage
+                connector = connector_class(session=self.http_session)
+            else:
+                connector.reset()
+            context.connectors[role] = connector
+            context.connector_limits[role] = threading.Semaphore(MAX_CONCURRENT_CONNECTOR_CALLS)
+
+    def _release_connectors(self, context: WorkflowExecutionContext):
+        """Return an execution's connectors to the idle pool for later runs."""
+        with self._idle_connectors_lock:
+            for connector in context.connectors.values():
+                self._idle_connectors.setdefault(type(connector), []).append(connector)
 
     def _check_dependencies(self, stage: StageConfig, context: WorkflowExecutionContext) -> bool:
         """Check if stage dependencies are met."""
-        if not stage.depends_on:
-            return True
-
-        completed_stages = {r.stage_id for r in context.stage_results if r.status == "success"}
-        return all(dep_id in completed_stages for dep_id in stage.depends_on)
+        return not stage.depends_on or context.completed_stage_ids.issuperset(stage.depends_on)
 
     def _get_stage_connector(self, stage: StageConfig, context: WorkflowExecutionContext) -> BaseConnector:
         """Get connector for a specific stage."""
@@ -284,18 +526,22 @@ class WorkflowEngine:
         if not stage.connector or not stage.method:
             raise ValueError(f"Stage {stage.id}: connector and method are required for connector_method type")
 
-        # Get the appropriate connector (default or stage-specific)
-        connector = self._get_stage_connector(stage, context)
         method_name = stage.method
 
-        if not hasattr(connector, method_name):
-            raise ValueError(f"Connector {stage.connector} does not have method {method_name}")
-
-        method = getattr(connector, method_name)
+        # Bound methods are resolved once per execution; connectors live on the context
+        method_key = (stage.connector, method_name)
+        method = context.connector_methods.get(method_key)
+        if method is None:
+            # Get the appropriate connector (default or stage-specific)
+            connector = self._get_stage_connector(stage, context)
+            method = getattr(connector, method_name, None)
+            if method is None:
+                raise ValueError(f"Connector {stage.connector} does not have method {method_name}")
+            context.connector_methods[method_key] = method
 
         # Prepare method arguments
         method_args = {}
-        sig = inspect.signature(method)
+        sig = _method_signature(getattr(method, "__func__", method))
 
         # Add parameters from stage config
         method_args.update(stage.parameters)
@@ -306,110 +552,90 @@ class WorkflowEngine:
                 method_args[var_name] = context.variables[var_name]
 
         # New simplified credential system using integration configs
-        connector_type = None
-        if stage.connector == "source":
-            connector_type = "shipstation"
-        elif stage.connector == "target":
-            connector_type = "infiplex"
-        
+        connector_type = _ROLE_SERVICE_TYPES.get(stage.connector)
         if connector_type:
-            try:
-                credentials = self.integration_configs.get(connector_type)
-                logger.info(f"Looking up credentials for {connector_type}: {credentials is not None}")
-                
-                # Add credentials to method args if the method expects them
-                if credentials and "api_key" in sig.parameters and "api_key" in credentials:
-                    method_args["api_key"] = credentials["api_key"]
-                    logger.info(f"Added API key for {connector_type} connector")
-                else:
-                    logger.warning(f"No API key available for {connector_type} connector. Credentials: {credentials is not None}, sig has api_key: {'api_key' in sig.parameters}")
-                
-                if credentials and "base_url" in sig.parameters and "base_url" in credentials:
-                    method_args["base_url"] = credentials["base_url"]
-                    logger.info(f"Added base URL for {connector_type} connector")
+            credentials = self.integration_configs.get(connector_type) or {}
+            # Add credentials to method args if the method expects them
+            for key in sig.credential_keys:
+                if key in credentials:
+                    method_args[key] = credentials[key]
                 else:
-                    logger.warning(f"No base URL available for {connector_type} connector. Credentials: {credentials is not None}, sig has base_url: {'base_url' in sig.parameters}")
-                    
-            except Exception as e:
-                logger.error(f"Failed to get credentials for {connector_type}: {e}")
-                # Continue execution - let the connector handle missing credentials
+                    logger.warning("No %s available for %s connector", key, connector_type)
 
         # Filter arguments to only include those the method accepts
-        
-        # Check if method accepts **kwargs (VAR_KEYWORD)
-        accepts_kwargs = any(
-            param.kind == inspect.Parameter.VAR_KEYWORD 
-            for param in sig.parameters.values()
-        )
-        
-        if accepts_kwargs:
-            # If method accepts **kwargs, pass all arguments through
-            filtered_args = {k: v for k, v in method_args.items() if k != 'self'}
+        if sig.accepts_kwargs:
+            # If method accepts **kwargs, pass all arguments through (method_args is ours to modify)
+            method_args.pop('self', None)
+            filtered_args = method_args
         else:
             # Otherwise, filter to only include named parameters
-            filtered_args = {
-                k: v for k, v in method_args.items()
-                if k in sig.parameters
-            }
+            filtered_args = {k: method_args[k] for k in method_args.keys() & sig.parameters}
 
-        logger.info(f"Calling {stage.connector}.{method_name} with args: {list(filtered_args.keys())}")
-        logger.info(f"Full arguments: {filtered_args}")
+        logger.info("Calling %s.%s with args: %s", stage.connector, method_name, list(filtered_args.keys()))
+        if logger.isEnabledFor(logging.DEBUG):
+            # Arguments can carry whole inventory payloads; only dump them when debugging
+            logger.debug("Full arguments: %r", filtered_args)
 
-        # Call the method
-        return method(**filtered_args)
+        # Call the method; coroutine methods get their own event loop on this worker thread
+        with context.connector_limits[stage.connector]:
+            if inspect.iscoroutinefunction(method):
+                return asyncio.run(method(**filtered_args))
+            return method(**filtered_args)
 
     def _execute_transform(self, stage: StageConfig, context: WorkflowExecutionContext) -> Any:
-        """Execute a data transformation."""
-        # Get input data
-        input_data = None
-        if stage.input_variables:
-            input_data = context.get_variable(stage.input_variables[0])
+        """Execute a data transformation.
 
-        transform_type = stage.parameters.get("transform_type", "identity")
+        Item checks test ``item.__class__ is dict`` first: JSON payloads are plain
+        dicts, and the isinstance fallback only runs for other types.
+        """
+        # Get input data
+        input_data = context.variables.get(stage.input_variables[0]) if stage.input_variables else None
 
-        if transform_type == "identity":
+        # identity (the default) and unknown transform types pass the input through
+        handler = self._transform_dispatch.get(stage.parameters.get("transform_type"))
+        if handler is None:
             return input_data
-        elif transform_type == "extract_field":
-            field = stage.parameters.get("field")
-            if isinstance(input_data, list):
-                return [item.get(field) for item in input_data if isinstance(item, dict)]
-            elif isinstance(input_data, dict):
-                return input_data.get(field)
-        elif transform_type == "filter_field":
-            field = stage.parameters.get("field")
-            value = stage.parameters.get("value")
-            if isinstance(input_data, list):
-                return [item for item in input_data if item.get(field) == value]
-        elif transform_type == "add_field":
-            field = stage.parameters.get("field")
-            value = stage.parameters.get("value")
-            if isinstance(input_data, list):
-                result = []
-                for item in input_data:
-                    if isinstance(item, dict):
-                        new_item = item.copy()
-                        new_item[field] = value
-                        result.append(new_item)
-                    else:
-                        result.append(item)
-                return result
-            elif isinstance(input_data, dict):
-                result = input_data.copy()
-                result[field] = value
-                return result
-        elif transform_type == "slice":
-            start = stage.parameters.get("start", 0)
-            end = stage.parameters.get("end", 5)
-            if isinstance(input_data, list):
-                return input_data[start:end]
+        return handler(input_data, stage.parameters)
 
+    def _transform_extract_field(self, input_data: Any, parameters: Dict[str, Any]) -> Any:
+        """Pull one field out of each item (or out of a single dict)."""
+        field = parameters.get("field")
+        if isinstance(input_data, list):
+            return [item.get(field) for item in input_data if item.__class__ is dict or isinstance(item, dict)]
+        elif isinstance(input_data, dict):
+            return input_data.get(field)
+        return input_data
+
+    def _transform_filter_field(self, input_data: Any, parameters: Dict[str, Any]) -> Any:
+        """Keep items whose field equals the given value."""
+        field = parameters.get("field")
+        value = parameters.get("value")
+        if isinstance(input_data, list):
+            return [item for item in input_data if item.get(field) == value]
+        return input_data
+
+    def _transform_add_field(self, input_data: Any, parameters: Dict[str, Any]) -> Any:
+        """Add a field with a fixed value to each item (or to a single dict)."""
+        field = parameters.get("field")
+        value = parameters.get("value")
+        if isinstance(input_data, list):
+            return [
+                {**item, field: value} if item.__class__ is dict or isinstance(item, dict) else item
+                for item in input_data
+            ]
+        elif isinstance(input_data, dict):
+            return {**input_data, field: value}
+        return input_data
+
+    def _transform_slice(self, input_data: Any, parameters: Dict[str, Any]) -> Any:
+        """Take a start:end slice of a list."""
+        if isinstance(input_data, list):
+            return input_data[parameters.get("start", 0):parameters.get("end", 5)]
         return input_data
 
     def _execute_filter(self, stage: StageConfig, context: WorkflowExecutionContext) -> Any:
         """Execute a filter operation."""
-        input_data = None
-        if stage.input_variables:
-            input_data = context.get_variable(stage.input_variables[0])
+        input_data = context.variables.get(stage.input_variables[0]) if stage.input_variables else None
 
         if not isinstance(input_data, list):
             return input_data
@@ -418,9 +644,9 @@ class WorkflowEngine:
         value_from_variable = stage.parameters.get("value_from_variable")
 
         if filter_field and value_from_variable:
-            filter_values = context.get_variable(value_from_variable)
+            filter_values = context.variables.get(value_from_variable)
             if isinstance(filter_values, list):
-                filter_set = set(filter_values)
+                filter_set = context.get_filter_set(value_from_variable, filter_values)
                 return [item for item in input_data if item.get(filter_field) in filter_set]
 
         # Fallback to original simple filter
@@ -432,16 +658,18 @@ class WorkflowEngine:
 
     def _execute_map_fields(self, stage: StageConfig, context: WorkflowExecutionContext) -> Any:
         """Execute field mapping."""
-        input_data = None
-        if stage.input_variables:
-            input_data = context.get_variable(stage.input_variables[0])
+        input_data = context.variables.get(stage.input_variables[0]) if stage.input_variables else None
 
         field_mappings = stage.parameters.get("mappings", {})
 
         if isinstance(input_data, list):
+            if not field_mappings:
+                # Nothing to rename; a plain copy keeps the output independent of the input
+                return [dict(item) for item in input_data if item.__class__ is dict or isinstance(item, dict)]
+            mapping_get = field_mappings.get
             return [
-                {field_mappings.get(k, k): v for k, v in item.items()}
-                for item in input_data if isinstance(item, dict)
+                {mapping_get(k, k): v for k, v in item.items()}
+                for item in input_data if item.__class__ is dict or isinstance(item, dict)
             ]
         elif isinstance(input_data, dict):
             return {field_mappings.get(k, k): v for k, v in input_data.items()}
@@ -463,18 +691,24 @@ class WorkflowEngine:
         message = stage.parameters.get("message", "")
         log_level = stage.parameters.get("level", "info").lower()
 
-        # Replace variables in message
-        for var_name, var_value in context.variables.items():
-            placeholder = f"{{{var_name}}}"
-            if placeholder in message:
-                message = message.replace(placeholder, str(var_value))
-            
-            len_placeholder = f"{{len({var_name})}}"
-            if len_placeholder in message:
-                if isinstance(var_value, list):
-                    message = message.replace(len_placeholder, str(len(var_value)))
+        # Replace placeholders that name a known variable; others are left as-is
+        if "{" in message:
+            variables = context.variables
+            # Distinguishes an unknown name (placeholder kept) from a variable set to None
+            missing = object()
+            parts = []
+            for literal, len_name, name, placeholder in _parse_log_template(message):
+                parts.append(literal)
+                if not placeholder:
+                    continue
+                value = variables.get(len_name or name, missing)
+                if value is missing:
+                    parts.append(placeholder)
+                elif len_name:
+                    parts.append(str(len(value)) if isinstance(value, list) else "N/A")
                 else:
-                    message = message.replace(len_placeholder, "N/A")
+                    parts.append(str(value))
+            message = "".join(parts)
 
         if log_level == "debug":
             logger.debug(message)
@@ -489,10 +723,13 @@ class WorkflowEngine:
 
     def _evaluate_condition(self, condition: str, context: WorkflowExecutionContext) -> bool:
         """Evaluate a simple condition."""
-        # For now, just check if a variable exists and is truthy
-        if condition.startswith("exists:"):
-            var_name = condition[7:]
-            return var_name in context.variables and context.variables[var_name]
+        kind, separator, argument = condition.partition(":")
+        handler = self._condition_dispatch.get(kind) if separator else None
+        if handler is None:
+            # More condition types can be added to _condition_dispatch
+            return True
+        return handler(argument, context)
 
-        # More condition types can be added here
-        return True 
\ No newline at end of file
+    def _condition_exists(self, var_name: str, context: WorkflowExecutionContext) -> bool:
+        """Check if a variable exists and is truthy."""
+        return var_name in context.variables and context.variables[var_name]
@@ -111,7 +111,7 @@ class WorkflowConfig(BaseModel):
     credentials_config: Optional[Dict[str, Dict[str, Any]]] = Field(None, description="Named credential configurations for stages")
     
     # Workflow stages
-    stages: List[StageConfig] = Field(..., description="Ordered list of stages")
+    stages: List[StageConfig] = Field(..., description="Stages in dependency order; stages with no depends_on or shared-variable link to each other may run concurrently")
     
     # Global settings
     variables: Dict[str, Any] = Field(default_factory=dict, description="Global workflow variables")
@@ -1,11 +1,26 @@
 """
 Services for Callie Integrations.
+
+Services are imported on first attribute access so that importing one of them
+(e.g. ``callie.services.secrets`` from the workflow engine) does not pull in
+the Google Cloud client libraries of the others.
 """
 
-from .firestore import FirestoreService
-from .scheduler import SchedulerService
+import importlib
 
 __all__ = [
     "FirestoreService",
     "SchedulerService",
-] 
\ No newline at end of file
+]
+
+_LAZY_IMPORTS = {
+    "FirestoreService": ".firestore",
+    "SchedulerService": ".scheduler",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
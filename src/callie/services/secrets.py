@@ -43,6 +43,10 @@ class SecretManagerService:
             logger.error(f"Failed to retrieve secret {secret_name}: {e}")
             raise
     
+    def clear_cache(self):
+        """Drop cached secret values so the next lookup hits Secret Manager."""
+        self._cache.clear()
+    
     def get_api_credentials(self) -> Dict[str, str]:
         """Get all API credentials needed for the application."""
         try:
@@ -0,0 +1,178 @@
+"""
+Tests for stage scheduling in the workflow engine.
+"""
+
+import threading
+import time
+
+import pytest
+
+from callie.connectors.base import BaseConnector, ConnectorCapability, ConnectorSchema
+from callie.engine.workflow_engine import WorkflowEngine
+from callie.models.stages import StageConfig, StageErrorStrategy, WorkflowConfig
+
+
+class RecordingConnector(BaseConnector):
+    """Connector whose calls record their name once they finish."""
+
+    calls = []
+    barrier = None
+
+    def get_capabilities(self) -> ConnectorCapability:
+        return ConnectorCapability()
+
+    def get_inventory_schema(self) -> ConnectorSchema:
+        return ConnectorSchema(fields=[])
+
+    def test_connection(self) -> bool:
+        return True
+
+    def _read_inventory(self, **filters):
+        return []
+
+    def _write_inventory(self, items):
+        return {}
+
+    def record(self, name: str, delay: float = 0, **kwargs):
+        time.sleep(delay)
+        RecordingConnector.calls.append(name)
+        return name
+
+    def rendezvous(self, name: str, **kwargs):
+        # Only returns if another stage reaches the barrier at the same time
+        RecordingConnector.barrier.wait()
+        return name
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    monkeypatch.delenv("GOOGLE_CLOUD_PROJECT", raising=False)
+    RecordingConnector.calls = []
+    RecordingConnector.barrier = threading.Barrier(2, timeout=5)
+    engine = WorkflowEngine()
+    engine.connector_classes = {"recording": RecordingConnector}
+    return engine
+
+
+def make_workflow(*stages: StageConfig) -> WorkflowConfig:
+    return WorkflowConfig(
+        id="test",
+        name="Test workflow",
+        source={"service_type": "recording"},
+        target={"service_type": "recording"},
+        stages=list(stages)
+    )
+
+
+def record_stage(stage_id: str, delay: float = 0, **kwargs) -> StageConfig:
+    return StageConfig(
+        id=stage_id,
+        type="connector_method",
+        connector="source",
+        method="record",
+        parameters={"name": stage_id, "delay": delay},
+        **kwargs
+    )
+
+
+def failing_stage(stage_id: str, **kwargs) -> StageConfig:
+    return StageConfig(id=stage_id, type="connector_method", connector="source", method="missing", **kwargs)
+
+
+def test_reader_waits_for_earlier_writer(engine):
+    execution = engine.execute_workflow(make_workflow(
+        record_stage("writer", delay=0.2, output_variable="x"),
+        record_stage("reader", input_variables=["x"])
+    ))
+
+    assert execution.status == "completed"
+    assert RecordingConnector.calls == ["writer", "reader"]
+
+
+def test_writer_waits_for_earlier_reader(engine):
+    execution = engine.execute_workflow(make_workflow(
+        record_stage("reader", delay=0.2, input_variables=["x"]),
+        record_stage("writer", output_variable="x")
+    ))
+
+    assert execution.status == "completed"
+    assert RecordingConnector.calls == ["reader", "writer"]
+
+
+def test_independent_stages_run_concurrently(engine):
+    stages = [
+        StageConfig(id=stage_id, type="connector_method", connector="source", method="rendezvous", parameters={"name": stage_id})
+        for stage_id in ("first", "second")
+    ]
+    execution = engine.execute_workflow(make_workflow(*stages))
+
+    assert execution.status == "completed"
+    assert execution.completed_stages == 2
+
+
+def test_results_follow_workflow_order(engine):
+    execution = engine.execute_workflow(make_workflow(
+        record_stage("slow", delay=0.2),
+        record_stage("fast")
+    ))
+
+    assert RecordingConnector.calls == ["fast", "slow"]
+    assert [result.stage_id for result in execution.stage_results] == ["slow", "fast"]
+
+
+def test_fail_strategy_stops_later_stages(engine):
+    execution = engine.execute_workflow(make_workflow(
+        failing_stage("broken", output_variable="x"),
+        record_stage("after", input_variables=["x"])
+    ))
+
+    assert execution.status == "failed"
+    assert execution.failed_stages == 1
+    assert RecordingConnector.calls == []
+    assert [result.stage_id for result in execution.stage_results] == ["broken"]
+
+
+def test_continue_strategy_runs_later_stages(engine):
+    execution = engine.execute_workflow(make_workflow(
+        failing_stage("broken", output_variable="x", error_strategy=StageErrorStrategy.CONTINUE),
+        record_stage("after", input_variables=["x"])
+    ))
+
+    assert execution.status == "completed"
+    assert execution.failed_stages == 1
+    assert execution.completed_stages == 1
+    assert RecordingConnector.calls == ["after"]
+
+
+def test_stage_depending_on_disabled_stage_does_not_run(engine):
+    execution = engine.execute_workflow(make_workflow(
+        record_stage("disabled", enabled=False),
+        record_stage("dependent", depends_on=["disabled"]),
+        record_stage("independent")
+    ))
+
+    assert execution.status == "completed"
+    assert RecordingConnector.calls == ["independent"]
+    assert [result.stage_id for result in execution.stage_results] == ["independent"]
+
+
+def test_stage_depending_on_skipped_stage_does_not_run(engine):
+    execution = engine.execute_workflow(make_workflow(
+        record_stage("conditional", condition="exists:never_set"),
+        record_stage("dependent", depends_on=["conditional"])
+    ))
+
+    assert execution.status == "completed"
+    assert execution.skipped_stages == 1
+    assert RecordingConnector.calls == []
+
+
+def test_depends_on_later_stage_is_rejected(engine):
+    execution = engine.execute_workflow(make_workflow(
+        record_stage("early", depends_on=["late"]),
+        record_stage("late")
+    ))
+
+    assert execution.status == "failed"
+    assert "earlier stage" in execution.error_message
+    assert RecordingConnector.calls == []